@@ -0,0 +1,59 @@
+"""
+    benchmarks.batched_rows
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare iget_data row by row with iget_data in batches
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/batched_rows.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import timeit
+
+from pyexcel_io import iget_data, save_data
+from pyexcel_io._compact import StringIO
+
+
+NUMBER_OF_ROWS = 200000
+
+
+def make_csv(number_of_columns):
+    rows = [[index * column for column in range(number_of_columns)]
+            for index in range(NUMBER_OF_ROWS)]
+    io = StringIO()
+    save_data(io, rows)
+    return io.getvalue()
+
+
+def run(number_of_columns, **keywords):
+    content = make_csv(number_of_columns)
+
+    def rows():
+        data, reader = iget_data(StringIO(content), **keywords)
+        for _ in data['csv']:
+            pass
+        reader.close()
+
+    def batches():
+        data, reader = iget_data(StringIO(content), batch_size=1000,
+                                 **keywords)
+        for _ in data['csv']:
+            pass
+        reader.close()
+
+    rows_time = min(timeit.repeat(rows, number=1, repeat=3))
+    batches_time = min(timeit.repeat(batches, number=1, repeat=3))
+    print("%d columns%s rows: %.3fs batches: %.3fs speed up: %.1fx" % (
+        number_of_columns, ' as text' if keywords else '',
+        rows_time, batches_time,
+        rows_time / batches_time))
+
+
+if __name__ == '__main__':
+    for number_of_columns in [1, 3, 10]:
+        run(number_of_columns)
+        run(number_of_columns, auto_detect_int=False,
+            auto_detect_float=False, auto_detect_datetime=False)
@@ -0,0 +1,49 @@
+"""
+    benchmarks.cell_detection
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare the compiled cell converter with the detect_* chain
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/cell_detection.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import timeit
+
+from pyexcel_io.service import detect_cell_value, make_cell_converter
+
+
+SAMPLES = {
+    'int': ['1', '23', '456', '7890', '-12', '1,234'],
+    'float': ['1.5', '-2.25', '3.125', '1e5', '0.75', '.5'],
+    'date': ['2016-05-04', '2017-01-31', '2016-05-04 17:39:12'],
+    'text': ['ACTIVE', 'GB', 'SKU-AB', 'pyexcel', 'N/A', 'x'],
+    'mixed': ['1', '1.5', '2016-05-04', 'ACTIVE', '007', 'GB']
+}
+NUMBER_OF_CELLS = 200000
+
+
+def run(name, cells):
+    cells = (cells * (NUMBER_OF_CELLS // len(cells) + 1))[:NUMBER_OF_CELLS]
+    convert = make_cell_converter()
+
+    def legacy():
+        for cell in cells:
+            detect_cell_value(cell)
+
+    def compiled():
+        for cell in cells:
+            convert(cell)
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=3))
+    compiled_time = min(timeit.repeat(compiled, number=1, repeat=3))
+    print("%-6s detect_* chain: %.3fs compiled: %.3fs speed up: %.1fx" % (
+        name, legacy_time, compiled_time, legacy_time / compiled_time))
+
+
+if __name__ == '__main__':
+    for column_type in ['int', 'float', 'date', 'text', 'mixed']:
+        run(column_type, SAMPLES[column_type])
@@ -0,0 +1,41 @@
+"""
+    benchmarks.column_selection
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read 5 columns out of 200 by columns, by column_limit and as a whole
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/column_selection.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+
+
+TEST_FILE = 'column_selection.csv'
+NUMBER_OF_ROWS = 5000
+NUMBER_OF_COLUMNS = 200
+
+
+if __name__ == '__main__':
+    save_data(TEST_FILE, [
+        [row * column for column in range(NUMBER_OF_COLUMNS)]
+        for row in range(NUMBER_OF_ROWS)])
+    try:
+        columns = [0, 50, 100, 150, 199]
+        whole = min(timeit.repeat(
+            lambda: get_data(TEST_FILE), number=1, repeat=3))
+        window = min(timeit.repeat(
+            lambda: get_data(TEST_FILE, column_limit=5), number=1, repeat=3))
+        selected = min(timeit.repeat(
+            lambda: get_data(TEST_FILE, columns=columns),
+            number=1, repeat=3))
+        print("whole rows %.3fs, column_limit=5 %.3fs, 5 columns %.3fs" % (
+            whole, window, selected))
+    finally:
+        os.unlink(TEST_FILE)
@@ -0,0 +1,41 @@
+"""
+    benchmarks.count_rows
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Count the rows of a large csv file by its line feeds and by reading it
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/count_rows.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import count_rows, get_data, save_data
+
+
+TEST_FILE = 'count_rows.csv'
+NUMBER_OF_ROWS = 200000
+
+
+def count_by_reading():
+    return len(get_data(TEST_FILE)[TEST_FILE])
+
+
+if __name__ == '__main__':
+    save_data(TEST_FILE, [
+        [index, 'name %d' % index, 'a "quoted"\nnote', 2.5, '2016-05-04']
+        for index in range(NUMBER_OF_ROWS)])
+    print("file of %.1f MB" % (os.path.getsize(TEST_FILE) / 1e6))
+    try:
+        assert count_rows(TEST_FILE)[TEST_FILE] == count_by_reading()
+        counted = min(timeit.repeat(
+            lambda: count_rows(TEST_FILE), number=1, repeat=5))
+        read = min(timeit.repeat(count_by_reading, number=1, repeat=3))
+        print("count_rows %.3fs, len(get_data) %.3fs, %.0f times faster" % (
+            counted, read, read / counted))
+    finally:
+        os.unlink(TEST_FILE)
@@ -0,0 +1,74 @@
+"""
+    benchmarks.date_parsing
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare parse_date_time with plain strptime on date columns
+
+    A high cardinality column has a new value in each cell, e.g. time
+    stamps. A low cardinality column repeats a handful of values, e.g.
+    order dates. Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/date_parsing.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import timeit
+import datetime
+
+from pyexcel_io.service import parse_date_time
+
+
+NUMBER_OF_CELLS = 200000
+START = datetime.datetime(2016, 5, 4, 17, 39, 12)
+
+
+def strptime_date_time(text):
+    """what detect_date_value used to do"""
+    ret = None
+    try:
+        if len(text) == 10:
+            ret = datetime.datetime.strptime(text, "%Y-%m-%d").date()
+        elif len(text) == 19:
+            ret = datetime.datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
+        elif len(text) > 19:
+            ret = datetime.datetime.strptime(
+                text[0:26], "%Y-%m-%d %H:%M:%S.%f")
+    except ValueError:
+        pass
+    return ret
+
+
+def make_column(distinct_values, with_time):
+    column = []
+    for index in range(NUMBER_OF_CELLS):
+        value = START + datetime.timedelta(
+            days=index % distinct_values, seconds=index % distinct_values)
+        if with_time:
+            column.append(str(value))
+        else:
+            column.append(str(value.date()))
+    return column
+
+
+def run(name, cells):
+    def legacy():
+        for cell in cells:
+            strptime_date_time(cell)
+
+    def fast():
+        parse_date_time.cache_clear()
+        for cell in cells:
+            parse_date_time(cell)
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=3))
+    fast_time = min(timeit.repeat(fast, number=1, repeat=3))
+    print("%-14s strptime: %.3fs parse_date_time: %.3fs speed up: %.1fx" % (
+        name, legacy_time, fast_time, legacy_time / fast_time))
+
+
+if __name__ == '__main__':
+    run('date, high', make_column(NUMBER_OF_CELLS, False))
+    run('date, low', make_column(50, False))
+    run('datetime, high', make_column(NUMBER_OF_CELLS, True))
+    run('datetime, low', make_column(50, True))
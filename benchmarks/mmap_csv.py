@@ -0,0 +1,49 @@
+"""
+    benchmarks.mmap_csv
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read the lines of a csv file in text mode and through a memory map
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/mmap_csv.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import csv
+import timeit
+
+from pyexcel_io import save_data
+from pyexcel_io.sheet import NamedContent
+from pyexcel_io.readers.csvr import CSVFileReader
+
+
+TEST_FILE = 'mmap_csv_benchmark.csv'
+NUMBER_OF_ROWS = 1000000
+
+
+def parse(encoding, use_mmap):
+    reader = CSVFileReader(NamedContent('csv', TEST_FILE),
+                           encoding=encoding, use_mmap=use_mmap)
+    for _ in csv.reader(reader.get_file_handle()):
+        pass
+    reader.close()
+
+
+if __name__ == '__main__':
+    for encoding in ['utf-8', 'utf-16']:
+        save_data(TEST_FILE, [
+            [index, u'caf\xe9 %d' % index, 'ACTIVE', '2016-05-04']
+            for index in range(NUMBER_OF_ROWS)], encoding=encoding)
+        try:
+            text_time = min(timeit.repeat(
+                lambda: parse(encoding, False), number=1, repeat=3))
+            mmap_time = min(timeit.repeat(
+                lambda: parse(encoding, True), number=1, repeat=3))
+            print("%s, %.1f MB: text mode: %.3fs mmap: %.3fs" % (
+                encoding, os.path.getsize(TEST_FILE) / 1e6,
+                text_time, mmap_time))
+        finally:
+            os.unlink(TEST_FILE)
@@ -0,0 +1,61 @@
+"""
+    benchmarks.multiple_sheet_stream
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the memory taken to stream the rows of a multi-sheet csv stream
+
+    tracemalloc is needed, hence python 3 only. Run it from the project
+    root::
+
+        $ PYTHONPATH=. python benchmarks/multiple_sheet_stream.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import time
+import tracemalloc
+
+from pyexcel_io import iget_data, save_data
+from pyexcel_io._compact import StringIO, OrderedDict
+
+
+NUMBER_OF_SHEETS = 4
+NUMBER_OF_ROWS = 100000
+
+
+def make_stream():
+    book = OrderedDict()
+    for sheet in range(NUMBER_OF_SHEETS):
+        book['sheet %d' % sheet] = [
+            [index, 'name %d' % index, 'ACTIVE', '2016-05-04']
+            for index in range(NUMBER_OF_ROWS)]
+    io = StringIO()
+    save_data(io, book)
+    # StringIO builds its read buffer on the first read. Do it here, so
+    # that it is not measured
+    io.read()
+    return io
+
+
+def measure(label, stream, **keywords):
+    tracemalloc.start()
+    started = time.time()
+    sheets, reader = iget_data(stream, multiple_sheets=True, **keywords)
+    count = 0
+    for rows in sheets.values():
+        for _ in rows:
+            count += 1
+    reader.close()
+    elapsed = time.time() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("%s: %d rows, %.2fs, peak %.1f MB" % (
+        label, count, elapsed, peak / 1e6))
+
+
+if __name__ == '__main__':
+    stream = make_stream()
+    print("stream of %.1f MB" % (len(stream.getvalue()) / 1e6))
+    measure("all sheets", stream)
+    measure("the last sheet", stream, sheet_index=NUMBER_OF_SHEETS - 1)
+    measure("the first sheet", stream, sheet_name='sheet 0')
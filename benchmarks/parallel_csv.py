@@ -0,0 +1,46 @@
+"""
+    benchmarks.parallel_csv
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read one large csv file with different number of workers
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/parallel_csv.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+import multiprocessing
+
+from pyexcel_io import get_data, save_data
+
+
+TEST_FILE = 'parallel_csv_benchmark.csv'
+NUMBER_OF_ROWS = 1000000
+
+
+def read(workers):
+    get_data(TEST_FILE, workers=workers)
+
+
+if __name__ == '__main__':
+    save_data(TEST_FILE, [
+        [index, index * 0.5, 'ACTIVE', '2016-05-04', 'line %d' % index]
+        for index in range(NUMBER_OF_ROWS)])
+    print("file size: %.1f MB, cpus: %d" % (
+        os.path.getsize(TEST_FILE) / 1e6, multiprocessing.cpu_count()))
+    try:
+        base_time = None
+        for workers in [1, 2, 4, 8, 16]:
+            if workers > multiprocessing.cpu_count():
+                break
+            spent = min(timeit.repeat(
+                lambda: read(workers), number=1, repeat=2))
+            base_time = base_time or spent
+            print("workers: %2d time: %.3fs speed up: %.1fx" % (
+                workers, spent, base_time / spent))
+    finally:
+        os.unlink(TEST_FILE)
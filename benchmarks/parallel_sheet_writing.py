@@ -0,0 +1,62 @@
+"""
+    benchmarks.parallel_sheet_writing
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Write a book of several sheets into csv files and into a csvz file, one
+    sheet after another and with parallel_sheets
+
+    The calling process pickles the rows for the workers, which serialize
+    the sheets on the other cores. For csvz, the calling process deflates
+    them. Hence it pays off on a machine with more than one cpu only.
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/parallel_sheet_writing.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import glob
+import time
+import timeit
+import multiprocessing
+
+from pyexcel_io import save_data
+from pyexcel_io._compact import OrderedDict
+
+
+NUMBER_OF_SHEETS = 8
+NUMBER_OF_ROWS = 50000
+
+
+def measure(test_file, data, parallel_sheets):
+    """
+    :returns: the wall clock time and the cpu time of the calling process
+    """
+    def write():
+        save_data(test_file, data, parallel_sheets=parallel_sheets)
+    try:
+        wall_clock = min(timeit.repeat(write, number=1, repeat=3))
+        cpu = min(timeit.repeat(write, timer=time.process_time,
+                                number=1, repeat=3))
+        return wall_clock, cpu
+    finally:
+        for file_name in glob.glob(test_file.replace('.', '*.')):
+            os.unlink(file_name)
+
+
+if __name__ == '__main__':
+    data = OrderedDict()
+    for index in range(NUMBER_OF_SHEETS):
+        data['sheet%d' % index] = [
+            [row, 'text %d' % row, row * 0.5, 'some longer text here']
+            for row in range(NUMBER_OF_ROWS)]
+    print("%d cpus, %d sheets of %d rows" % (
+        multiprocessing.cpu_count(), NUMBER_OF_SHEETS, NUMBER_OF_ROWS))
+    for test_file in ['parallel_sheet_writing.csv',
+                      'parallel_sheet_writing.csvz']:
+        for parallel_sheets in [1, 2, 4]:
+            print("%s, parallel_sheets=%d: %.3fs, calling process %.3fs "
+                  "cpu" % ((test_file.split('.')[1], parallel_sheets) +
+                           measure(test_file, data, parallel_sheets)))
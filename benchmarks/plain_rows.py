@@ -0,0 +1,51 @@
+"""
+    benchmarks.plain_rows
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read sheets of several widths with the default options, from a plugin
+    that gives cells one by one and from a csv file
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/plain_rows.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io.sheet import SheetReader
+
+
+TEST_FILE = 'plain_rows.csv'
+NUMBER_OF_CELLS = 1000000
+
+
+class CellReader(SheetReader):
+    def number_of_rows(self):
+        return len(self._native_sheet)
+
+    def number_of_columns(self):
+        return len(self._native_sheet[0])
+
+    def cell_value(self, row, column):
+        return self._native_sheet[row][column]
+
+
+if __name__ == '__main__':
+    for width in [5, 20, 100]:
+        # a few trailing empty cells on every row
+        sheet = [[row * column for column in range(width - 2)] + ['', '']
+                 for row in range(NUMBER_OF_CELLS // width)]
+        plugin = min(timeit.repeat(
+            lambda: list(CellReader(sheet).to_array()), number=1, repeat=3))
+        save_data(TEST_FILE, sheet)
+        try:
+            in_csv = min(timeit.repeat(
+                lambda: get_data(TEST_FILE), number=1, repeat=3))
+        finally:
+            os.unlink(TEST_FILE)
+        print("%3d columns, %d rows: plugin %.3fs, csv %.3fs" % (
+            width, len(sheet), plugin, in_csv))
@@ -0,0 +1,71 @@
+"""
+    benchmarks.quote_free_split
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read csv and tsv files with and without the str.split tokenizer, when
+    nothing is quoted and when a quote turns up near the end
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/quote_free_split.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io.sheet import NamedContent
+from pyexcel_io.readers.csvr import CSVFileReader
+
+
+NUMBER_OF_ROWS = 200000
+NO_DETECTION = dict(auto_detect_int=False, auto_detect_float=False,
+                    auto_detect_datetime=False)
+
+
+def measure(test_file, **keywords):
+    return min(timeit.repeat(
+        lambda: get_data(test_file, **keywords), number=1, repeat=5))
+
+
+def tokenize(test_file, **keywords):
+    def read():
+        reader = CSVFileReader(NamedContent('csv', test_file), **keywords)
+        list(reader.row_iterator())
+        reader.close()
+    return min(timeit.repeat(read, number=1, repeat=5))
+
+
+if __name__ == '__main__':
+    sheet = [['row%d' % row, row, row * 0.5, 'some text', '', 'x']
+             for row in range(NUMBER_OF_ROWS)]
+    for file_type in ['csv', 'tsv']:
+        for quoted in ['no quote', 'late quote']:
+            test_file = 'quote_free_split.' + file_type
+            if quoted == 'late quote':
+                sheet[-10][3] = 'a "quoted", text'
+            save_data(test_file, sheet)
+            try:
+                delimiter = '\t' if file_type == 'tsv' else ','
+                with_csv_reader = tokenize(
+                    test_file, delimiter=delimiter, fast_split=False)
+                with_split = tokenize(test_file, delimiter=delimiter)
+                print("%s, %s, rows only: csv.reader %.3fs, "
+                      "str.split %.3fs" % (
+                          file_type, quoted, with_csv_reader, with_split))
+                for label, options in [('raw', NO_DETECTION),
+                                       ('detected', {})]:
+                    with_csv_reader = measure(
+                        test_file, fast_split=False, **options)
+                    with_split = measure(test_file, **options)
+                    assert get_data(test_file, **options) == get_data(
+                        test_file, fast_split=False, **options)
+                    print("%s, %s, %s cells: csv.reader %.3fs, "
+                          "str.split %.3fs" % (
+                              file_type, quoted, label,
+                              with_csv_reader, with_split))
+            finally:
+                os.unlink(test_file)
+            sheet[-10][3] = 'some text'
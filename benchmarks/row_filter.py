@@ -0,0 +1,51 @@
+"""
+    benchmarks.row_filter
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Keep 5% of the rows of a csv file by row_filter and after get_data
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/row_filter.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+
+
+TEST_FILE = 'row_filter.csv'
+NUMBER_OF_ROWS = 200000
+
+
+def filter_after_reading():
+    return [row for row in get_data(TEST_FILE)[TEST_FILE]
+            if row[2] == 'RARE']
+
+
+def filter_by_predicate():
+    return get_data(TEST_FILE, row_filter={
+        2: lambda cell: cell == 'RARE'})[TEST_FILE]
+
+
+def filter_by_function():
+    return get_data(TEST_FILE, row_filter=lambda cells: cells[2] == 'RARE')[
+        TEST_FILE]
+
+
+if __name__ == '__main__':
+    save_data(TEST_FILE, [
+        [index, 'name %d' % index, 'RARE' if index % 20 == 0 else 'COMMON',
+         2.5, '2016-05-04']
+        for index in range(NUMBER_OF_ROWS)])
+    try:
+        assert filter_after_reading() == filter_by_predicate()
+        for function in [filter_after_reading, filter_by_predicate,
+                         filter_by_function]:
+            print("%s %.3fs" % (function.__name__, min(
+                timeit.repeat(function, number=1, repeat=3))))
+    finally:
+        os.unlink(TEST_FILE)
@@ -0,0 +1,50 @@
+"""
+    benchmarks.row_index
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Page through a large csv file with and without the row index sidecar
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/row_index.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+
+
+TEST_FILE = 'row_index.csv'
+NUMBER_OF_ROWS = 200000
+PAGE_SIZE = 1000
+NUMBER_OF_PAGES = 20
+
+
+def read_pages(**keywords):
+    step = NUMBER_OF_ROWS // NUMBER_OF_PAGES
+    for start_row in range(0, NUMBER_OF_ROWS, step):
+        get_data(TEST_FILE, start_row=start_row, row_limit=PAGE_SIZE,
+                 **keywords)
+
+
+if __name__ == '__main__':
+    save_data(TEST_FILE, [
+        [index, 'name %d' % index, 'ACTIVE', 2.5, '2016-05-04']
+        for index in range(NUMBER_OF_ROWS)])
+    print("file of %.1f MB" % (os.path.getsize(TEST_FILE) / 1e6))
+    try:
+        without_index = min(timeit.repeat(
+            read_pages, number=1, repeat=3))
+        building = timeit.timeit(
+            lambda: read_pages(row_index_step=1000), number=1)
+        with_index = min(timeit.repeat(
+            lambda: read_pages(row_index_step=1000), number=1, repeat=3))
+        print("%d pages: without index %.3fs, building the index %.3fs, "
+              "with the index %.3fs" % (NUMBER_OF_PAGES, without_index,
+                                        building, with_index))
+    finally:
+        os.unlink(TEST_FILE)
+        os.unlink(TEST_FILE + '.pyexcel-idx')
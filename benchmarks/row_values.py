@@ -0,0 +1,48 @@
+"""
+    benchmarks.row_values
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read a sheet of a plugin by cell_value per cell and by row_values per row
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/row_values.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import timeit
+
+from pyexcel_io.sheet import SheetReader
+
+
+NUMBER_OF_ROWS = 20000
+
+
+class CellReader(SheetReader):
+    def number_of_rows(self):
+        return len(self._native_sheet)
+
+    def number_of_columns(self):
+        return len(self._native_sheet[0])
+
+    def cell_value(self, row, column):
+        return self._native_sheet[row][column]
+
+
+class RowReader(CellReader):
+    def row_values(self, row):
+        return list(self._native_sheet[row])
+
+
+if __name__ == '__main__':
+    for width in [5, 20, 100]:
+        sheet = [[row * column for column in range(width)]
+                 for row in range(NUMBER_OF_ROWS)]
+        timings = []
+        for reader_class in [CellReader, RowReader]:
+            timings.append(min(timeit.repeat(
+                lambda: list(reader_class(sheet).to_array()),
+                number=1, repeat=3)))
+        print("%3d columns: cell_value %.3fs, row_values %.3fs" % (
+            width, timings[0], timings[1]))
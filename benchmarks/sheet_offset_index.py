@@ -0,0 +1,59 @@
+"""
+    benchmarks.sheet_offset_index
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read one sheet out of many from a multi-sheet csv stream in memory and
+    from a text file, which cannot be seeked by position
+
+    Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/sheet_offset_index.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io._compact import StringIO, OrderedDict
+
+
+TEST_FILE = 'sheet_offset_index.csv'
+NUMBER_OF_SHEETS = 40
+NUMBER_OF_ROWS = 5000
+
+
+def make_stream():
+    book = OrderedDict()
+    for sheet in range(NUMBER_OF_SHEETS):
+        book['sheet %d' % sheet] = [
+            [index, 'name %d' % index, 'ACTIVE', '2016-05-04']
+            for index in range(NUMBER_OF_ROWS)]
+    io = StringIO()
+    save_data(io, book)
+    return io
+
+
+def read_from_file(sheet_name):
+    with open(TEST_FILE, 'r', newline='') as stream:
+        get_data(stream, file_type='csv', multiple_sheets=True,
+                 sheet_name=sheet_name)
+
+
+if __name__ == '__main__':
+    stream = make_stream()
+    with open(TEST_FILE, 'w', newline='') as f:
+        f.write(stream.getvalue())
+    print("stream of %.1f MB" % (len(stream.getvalue()) / 1e6))
+    try:
+        for sheet_name in ['sheet 0', 'sheet %d' % (NUMBER_OF_SHEETS - 1)]:
+            in_memory = min(timeit.repeat(lambda: get_data(
+                stream, file_type='csv', multiple_sheets=True,
+                sheet_name=sheet_name), number=1, repeat=5))
+            in_file = min(timeit.repeat(
+                lambda: read_from_file(sheet_name), number=1, repeat=5))
+            print("%s: in memory %.3fs, from a text file %.3fs" % (
+                sheet_name, in_memory, in_file))
+    finally:
+        os.unlink(TEST_FILE)
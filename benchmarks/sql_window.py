@@ -0,0 +1,59 @@
+"""
+    benchmarks.sql_window
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read 100 rows deep in a sqlalchemy table, as a window and as a whole
+
+    sqlalchemy is needed. Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/sql_window.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import timeit
+
+from sqlalchemy import create_engine, Column, Integer, String
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+
+from pyexcel_io.database.exporters.sqlalchemy import SQLTableReader
+
+
+NUMBER_OF_ROWS = 200000
+START_ROW = 150000
+ROW_LIMIT = 100
+Base = declarative_base()
+
+
+class Record(Base):
+    __tablename__ = 'record'
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+def read_window(session):
+    reader = SQLTableReader(session, Record)
+    reader.set_window(start_row=START_ROW, row_limit=ROW_LIMIT)
+    return list(reader.to_array())
+
+
+def read_whole_table(session):
+    reader = SQLTableReader(session, Record)
+    return list(reader.to_array())[START_ROW:START_ROW + ROW_LIMIT]
+
+
+if __name__ == '__main__':
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([Record(id=index, name='name %d' % index)
+                     for index in range(NUMBER_OF_ROWS)])
+    session.commit()
+    assert read_window(session) == read_whole_table(session)
+    window = min(timeit.repeat(
+        lambda: read_window(session), number=1, repeat=3))
+    whole = min(timeit.repeat(
+        lambda: read_whole_table(session), number=1, repeat=3))
+    print("%d rows from row %d: window %.3fs, whole table %.3fs" % (
+        ROW_LIMIT, START_ROW, window, whole))
@@ -0,0 +1,58 @@
+"""
+    benchmarks.string_interning
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the memory taken by a csv sheet with and without intern_strings
+
+    tracemalloc is needed, hence python 3 only. Run it from the project
+    root::
+
+        $ PYTHONPATH=. python benchmarks/string_interning.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import random
+import tracemalloc
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io._compact import StringIO
+
+
+NUMBER_OF_ROWS = 100000
+STATUSES = ['ACTIVE', 'INACTIVE', 'PENDING']
+COUNTRIES = ['GB', 'FR', 'DE', 'US', 'CN', 'JP', 'BR', 'IN']
+
+
+def make_csv():
+    random.seed(0)
+    rows = [['status', 'country', 'sku', 'reference']]
+    for index in range(NUMBER_OF_ROWS):
+        rows.append([
+            random.choice(STATUSES),
+            random.choice(COUNTRIES),
+            'SKU-%04d' % random.randint(0, 500),
+            'REF-%08d' % index
+        ])
+    io = StringIO()
+    save_data(io, rows)
+    return io.getvalue()
+
+
+def measure(content, **keywords):
+    tracemalloc.start()
+    data = get_data(StringIO(content), **keywords)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+if __name__ == '__main__':
+    content = make_csv()
+    print("csv content: %.1f MB" % (len(content) / 1e6))
+    plain = measure(content)
+    interned = measure(content, intern_strings=True)
+    print("lists of str: %.1f MB" % (plain / 1e6))
+    print("intern_strings=True: %.1f MB, %.0f%% saved" % (
+        interned / 1e6, 100.0 * (plain - interned) / plain))
@@ -0,0 +1,69 @@
+"""
+    benchmarks.write_rows
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Write rows to a csv file and to a sqlalchemy table
+
+    sqlalchemy is needed. Run it from the project root::
+
+        $ PYTHONPATH=. python benchmarks/write_rows.py
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import timeit
+
+from sqlalchemy import create_engine, Column, Integer, String, Float
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+
+from pyexcel_io import save_data
+from pyexcel_io.constants import DB_SQL
+from pyexcel_io.database.common import (
+    SQLTableImporter,
+    SQLTableImportAdapter
+)
+
+
+TEST_FILE = 'write_rows.csv'
+NUMBER_OF_ROWS = 200000
+NUMBER_OF_RECORDS = 50000
+Base = declarative_base()
+
+
+class Record(Base):
+    __tablename__ = 'record'
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    price = Column(Float)
+
+
+def write_table(**keywords):
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    importer = SQLTableImporter(session)
+    adapter = SQLTableImportAdapter(Record)
+    adapter.column_names = ['id', 'name', 'price']
+    importer.append(adapter)
+    save_data(importer, {adapter.get_name(): [
+        [index, 'name %d' % index, 2.5]
+        for index in range(NUMBER_OF_RECORDS)]},
+        file_type=DB_SQL, **keywords)
+    session.close()
+
+
+if __name__ == '__main__':
+    rows = [[index, 'name %d' % index, 'ACTIVE', 2.5, '2016-05-04']
+            for index in range(NUMBER_OF_ROWS)]
+    try:
+        print("csv, %d rows: %.3fs" % (NUMBER_OF_ROWS, min(timeit.repeat(
+            lambda: save_data(TEST_FILE, rows), number=1, repeat=3))))
+    finally:
+        os.unlink(TEST_FILE)
+    for bulk_insert in [False, True]:
+        print("sqlalchemy, %d records, bulk_insert=%s: %.3fs" % (
+            NUMBER_OF_RECORDS, bulk_insert, min(timeit.repeat(
+                lambda: write_table(bulk_insert=bulk_insert),
+                number=1, repeat=3))))
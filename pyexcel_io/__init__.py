@@ -11,7 +11,8 @@ import logging
 from ._compact import NullHandler
 logging.getLogger(__name__).addHandler(NullHandler())  # noqa
 
-from .io import get_data, iget_data, save_data  # noqa
+from .io import get_data, iget_data, save_data, get_sheet_names  # noqa
+from .io import count_rows, get_dimensions  # noqa
 import pyexcel_io.plugins as plugins
 
 
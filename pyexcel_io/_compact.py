@@ -28,6 +28,15 @@ if PY26:
 else:
     from collections import OrderedDict
 
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize=128):
+        """python 2 does not have it, hence no caching"""
+        def decorator(function):
+            return function
+        return decorator
+
 try:
     from logging import NullHandler
 except ImportError:
@@ -40,6 +49,10 @@ if PY2:
     from cStringIO import StringIO as BytesIO
     text_type = unicode
     irange = xrange
+    from itertools import izip_longest as zip_longest
+    from itertools import ifilter
+    # array does not have 'q' until python 3.3
+    INT_TYPECODE = 'l'
 
     class Iterator(object):
         def next(self):
@@ -50,6 +63,9 @@ else:
     text_type = str
     Iterator = object
     irange = range
+    from itertools import zip_longest
+    ifilter = filter
+    INT_TYPECODE = 'q'
 
 
 def isstream(instance):
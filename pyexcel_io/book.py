@@ -68,6 +68,8 @@ class BookReader(RWInterface):
         self._file_stream = None
         self._keywords = None
         self._native_book = None
+        self.__sheet_index = {}
+        self.__indexed_book = None
 
     def open(self, file_name, **keywords):
         """
@@ -124,8 +126,7 @@ class BookReader(RWInterface):
         """
         read a named sheet from a excel data book
         """
-        named_contents = [content for content in self._native_book
-                          if content.name == sheet_name]
+        named_contents = self._get_sheet_index().get(sheet_name, [])
         if len(named_contents) == 1:
             return {named_contents[0].name: self.read_sheet(named_contents[0])}
         else:
@@ -169,6 +170,49 @@ class BookReader(RWInterface):
         """
         raise NotImplementedError("Please implement this method")
 
+    def count_rows(self):
+        """
+        the number of rows of each sheet
+
+        override it when the rows can be counted without being read
+        """
+        result = OrderedDict()
+        for name, rows in self.read_all().items():
+            result[name] = sum(1 for _ in rows)
+        return result
+
+    def get_dimensions(self):
+        """
+        the number of rows and columns of each sheet
+        """
+        result = OrderedDict()
+        for name, rows in self.read_all().items():
+            number_of_rows = number_of_columns = 0
+            for row in rows:
+                number_of_rows += 1
+                number_of_columns = max(number_of_columns, len(row))
+            result[name] = (number_of_rows, number_of_columns)
+        return result
+
+    def get_sheet_names(self):
+        """
+        the names of the sheets, without reading any of them
+        """
+        return [sheet.name for sheet in self._native_book]
+
+    def _get_sheet_index(self):
+        """
+        the sheets by their names
+
+        it is built once per native book, which is set by open methods
+        """
+        if self.__indexed_book is not self._native_book:
+            self.__sheet_index = {}
+            for sheet in self._native_book:
+                self.__sheet_index.setdefault(sheet.name, []).append(sheet)
+            self.__indexed_book = self._native_book
+        return self.__sheet_index
+
 
 class BookWriter(RWInterface):
     """
@@ -178,14 +222,18 @@ class BookWriter(RWInterface):
         super(BookWriter, self).__init__()
         self._file_alike_object = None
         self._keywords = None
+        self._parallel_sheets = 1
 
     def open(self, file_name, **keywords):
         """
         open a file with unlimited keywords for writing
 
-        keywords are passed on to individual writers
+        keywords are passed on to individual writers, except
+        parallel_sheets, which is for the book writers that can
+        write sheets concurrently
         """
         self._file_alike_object = file_name
+        self._parallel_sheets = keywords.pop('parallel_sheets', 1)
         self._keywords = keywords
 
     def open_stream(self, file_stream, **keywords):
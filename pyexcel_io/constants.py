@@ -23,6 +23,9 @@ MESSAGE_CANNOT_READ_FILE_TYPE_FORMATTER = "Cannot read content of file type %s f
 MESSAGE_LOADING_FORMATTER = "The plugin for file type %s is not installed. Please install %s"
 MESSAGE_EMPTY_ARRAY = "One empty row is found"
 MESSAGE_IGNORE_ROW = "One row is ignored"
+MESSAGE_UNKNOWN_LAYOUT = "Unknown layout %s. Please use 'rows', 'columns' or 'numpy'"
+MESSAGE_BATCHES_IN_ROWS_ONLY = "batch_size cannot be used with layout other than 'rows'"
+MESSAGE_NUMPY_NOT_INSTALLED = "layout='numpy' needs numpy. Please install numpy"
 MESSAGE_DB_EXCEPTION = """
 Warning: Bulk insertion got below exception. Trying to do it one by one slowly."""
 
@@ -43,6 +46,18 @@ SKIP_DATA = -1
 TAKE_DATA = 0
 STOP_ITERATION = 1
 
+DEFAULT_INTERN_POOL_SIZE = 1000
+# write_array hands rows over to write_rows in chunks of this many rows
+DEFAULT_WRITE_BATCH_SIZE = 1000
+# to_array reads the rows of a sheet in chunks of this many rows
+DEFAULT_READ_CHUNK_SIZE = 100
+
+LAYOUT_ROWS = 'rows'
+LAYOUT_COLUMNS = 'columns'
+LAYOUT_NUMPY = 'numpy'
+LAYOUTS = (LAYOUT_ROWS, LAYOUT_COLUMNS, LAYOUT_NUMPY)
+DEFAULT_NUMPY_CHUNK_SIZE = 10000
+
 
 DEFAULT_MULTI_CSV_SEPARATOR = '__'
 SEPARATOR_FORMATTER = '---%s---' % DEFAULT_NAME + "%s"
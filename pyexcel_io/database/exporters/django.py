@@ -35,11 +35,13 @@ class DjangoBookReader(DbExporter):
 
     def export_tables(self, file_content, **keywords):
         self.exporter = file_content
+        self._keywords = keywords
         self._load_from_django_models()
 
     def read_sheet(self, native_sheet):
         reader = DjangoModelReader(native_sheet.model,
-                                   native_sheet.export_columns)
+                                   native_sheet.export_columns,
+                                   **self._keywords)
         return reader.to_array()
 
     def _load_from_django_models(self):
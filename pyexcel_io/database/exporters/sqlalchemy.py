@@ -15,16 +15,18 @@ class SQLTableReader(QuerysetsReader):
     """Read a table
     """
     def __init__(self, session, table, export_columns=None, **keywords):
-        everything = session.query(table).all()
+        # the query is run when the rows are read, for the rows asked for
+        query = session.query(table)
         column_names = None
         if export_columns:
             column_names = export_columns
         else:
-            if len(everything) > 0:
+            first_record = query.first()
+            if first_record is not None:
                 column_names = sorted([
-                    column for column in everything[0].__dict__
+                    column for column in first_record.__dict__
                     if column != '_sa_instance_state'])
-        QuerysetsReader.__init__(self, everything, column_names, **keywords)
+        QuerysetsReader.__init__(self, query, column_names, **keywords)
 
 
 class SQLBookReader(DbExporter):
@@ -35,13 +37,15 @@ class SQLBookReader(DbExporter):
 
     def export_tables(self, file_content, **keywords):
         self.__exporter = file_content
+        self._keywords = keywords
         self._load_from_tables()
 
     def read_sheet(self, native_sheet):
         reader = SQLTableReader(
             self.__exporter.session,
             native_sheet.table,
-            native_sheet.export_columns)
+            native_sheet.export_columns,
+            **self._keywords)
         return reader.to_array()
 
     def _load_from_tables(self):
@@ -31,17 +31,24 @@ class DjangoModelWriter(SheetWriter):
         self.__bulk_save = bulk_save
 
     def write_row(self, array):
-        if is_empty_array(array):
-            print(constants.MESSAGE_EMPTY_ARRAY)
-        else:
-            new_array = swap_empty_string_for_none(array)
-            model_to_be_created = new_array
-            if self.__initializer is not None:
-                model_to_be_created = self.__initializer(new_array)
+        self.write_rows([array])
+
+    def write_rows(self, rows):
+        # the models are created in one go by close()
+        model = self.__model
+        column_names = self.__column_names
+        initializer = self.__initializer
+        objs = self.__objs
+        for array in rows:
+            if is_empty_array(array):
+                print(constants.MESSAGE_EMPTY_ARRAY)
+                continue
+            model_to_be_created = swap_empty_string_for_none(array)
+            if initializer is not None:
+                model_to_be_created = initializer(model_to_be_created)
             if model_to_be_created:
-                self.__objs.append(self.__model(**dict(
-                    zip(self.__column_names, model_to_be_created)
-                )))
+                objs.append(model(**dict(
+                    zip(column_names, model_to_be_created))))
             # else
                 # skip the row
 
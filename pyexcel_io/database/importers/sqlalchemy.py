@@ -25,12 +25,13 @@ class SQLTableWriter(SheetWriter):
     """Write to a table
     """
     def __init__(self, importer, adapter, auto_commit=True,
-                 bulk_size=1000, **keywords):
+                 bulk_size=1000, bulk_insert=False, **keywords):
         SheetWriter.__init__(self, importer, adapter,
                              adapter.get_name(), **keywords)
         self.__auto_commit = auto_commit
         self.__count = 0
         self.__bulk_size = bulk_size
+        self.__bulk_insert = bulk_insert
 
     def write_row(self, array):
         if is_empty_array(array):
@@ -43,7 +44,52 @@ class SQLTableWriter(SheetWriter):
                 print(constants.MESSAGE_IGNORE_ROW)
                 print(new_array)
 
+    def write_rows(self, rows):
+        """
+        insert the rows in one statement if bulk_insert is set
+
+        the bulk statement skips validators, property setters and attribute
+        events, hence the objects are added one by one unless asked for.
+        a row initializer may look up the rows written before and non-column
+        attributes are only set on objects, so both are added one by one too.
+        """
+        column_names = self._native_sheet.column_names
+        mapping_dict = self._native_sheet.column_name_mapping_dict
+        keys = column_names
+        if mapping_dict is not None:
+            keys = [mapping_dict[name] for name in column_names]
+        if not self.__can_bulk_insert(keys):
+            SheetWriter.write_rows(self, rows)
+            return
+        mappings = []
+        for array in rows:
+            if is_empty_array(array):
+                print(constants.MESSAGE_EMPTY_ARRAY)
+                continue
+            mappings.append(dict(zip(keys, swap_empty_string_for_none(array))))
+        self._native_book.session.bulk_insert_mappings(
+            self._native_sheet.table, mappings)
+        self.__commit_every_bulk_size(len(mappings))
+
+    def __can_bulk_insert(self, keys):
+        if not self.__bulk_insert or self._native_sheet.row_initializer:
+            return False
+        from sqlalchemy import inspect
+        column_keys = inspect(self._native_sheet.table).column_attrs.keys()
+        return set(keys).issubset(column_keys)
+
     def _write_row(self, array):
+        self._native_book.session.add(self.__make_object(array))
+        self.__commit_every_bulk_size(1)
+
+    def __commit_every_bulk_size(self, number_of_objects):
+        if self.__auto_commit and self.__bulk_size != float('inf'):
+            count = self.__count + number_of_objects
+            if count // self.__bulk_size > self.__count // self.__bulk_size:
+                self._native_book.session.commit()
+            self.__count = count
+
+    def __make_object(self, array):
         row = dict(zip(self._native_sheet.column_names, array))
         obj = None
         if self._native_sheet.row_initializer:
@@ -58,11 +104,7 @@ class SQLTableWriter(SheetWriter):
                 else:
                     key = name
                 setattr(obj, key, row[name])
-        self._native_book.session.add(obj)
-        if self.__auto_commit and self.__bulk_size != float('inf'):
-            self.__count += 1
-            if self.__count % self.__bulk_size == 0:
-                self._native_book.session.commit()
+        return obj
 
     def close(self):
         if self.__auto_commit:
@@ -75,10 +117,12 @@ class SQLBookWriter(BookWriter):
         BookWriter.__init__(self)
         self.__importer = None
         self.__auto_commit = True
+        self._keywords = None
 
     def open_content(self, file_content, auto_commit=True, **keywords):
         self.__importer = file_content
         self.__auto_commit = auto_commit
+        self._keywords = keywords
 
     def create_sheet(self, sheet_name):
         sheet_writer = None
@@ -86,7 +130,8 @@ class SQLBookWriter(BookWriter):
         if adapter:
             sheet_writer = SQLTableWriter(
                 self.__importer, adapter,
-                auto_commit=self.__auto_commit
+                auto_commit=self.__auto_commit,
+                bulk_insert=self._keywords.get('bulk_insert', False)
             )
         else:
             raise Exception("No suitable database adapter found!")
@@ -11,12 +11,22 @@ import datetime
 from itertools import chain
 
 from pyexcel_io.sheet import SheetReader
+from pyexcel_io.utils import _column_indices
 
 
 class QuerysetsReader(SheetReader):
-    """ turn querysets into an array """
-    def __init__(self, query_sets, column_names, **keywords):
+    """ turn querysets into an array
+
+    columns, by index or by name, restricts the attributes that are read.
+    The row window is read by slicing the query sets, which django and
+    sqlalchemy turn into OFFSET and LIMIT.
+    """
+    def __init__(self, query_sets, column_names, columns=None, **keywords):
         SheetReader.__init__(self, query_sets, **keywords)
+        if columns is not None and column_names:
+            column_names = [
+                column_names[index]
+                for index in _column_indices(columns, column_names)]
         self.__column_names = column_names
         self.__query_sets = query_sets
 
@@ -24,7 +34,8 @@ class QuerysetsReader(SheetReader):
         """
         Convert query sets into an array
         """
-        if len(self.__query_sets) == 0:
+        # one record is enough to tell, even for a query
+        if len(self.__query_sets[:1]) == 0:
             yield []
         for element in SheetReader.to_array(self):
             yield element
@@ -33,6 +44,30 @@ class QuerysetsReader(SheetReader):
         return chain([self.__column_names],
                      self.__query_sets)
 
+    def rows(self, start=0, stop=None):
+        header = []
+        if start == 0 and stop != 0:
+            header = [self.__column_names]
+        # the first row is the header
+        record_stop = None
+        if stop is not None:
+            record_stop = max(stop - 1, 0)
+        return chain(header,
+                     self.__query_sets[max(start - 1, 0):record_stop])
+
+    def row_values(self, row):
+        return self._row_values(row, slice(0, None))
+
+    def _row_values(self, row, column_window):
+        if self.__column_names is None:
+            return []
+        if isinstance(row, list):
+            return row[column_window]
+        # the attributes outside the window are not read
+        return [get_complex_attribute(row, column) if '__' in column
+                else get_simple_attribute(row, column)
+                for column in self.__column_names[column_window]]
+
     def column_iterator(self, row):
         if self.__column_names is None:
             return
@@ -8,10 +8,13 @@
     :license: New BSD License, see LICENSE for more details
 """
 from types import GeneratorType
+import pickle
 import warnings
+import multiprocessing
 
-from pyexcel_io._compact import isstream, PY2
+from pyexcel_io._compact import isstream, PY2, OrderedDict
 from pyexcel_io.plugins import READERS, WRITERS
+from pyexcel_io.utils import to_columns, to_numpy
 import pyexcel_io.constants as constants
 
 
@@ -32,6 +35,38 @@ def iget_data(afile, file_type=None, **keywords):
     :param auto_detect_int: defaults to True
     :param auto_detect_datetime: defaults to True
     :param ignore_infinity: defaults to True
+    :param infer_sample_rows: csv only. Lock the type of each int, float or
+                              date column after looking at the first n
+                              rows. Defaults to 0,
+                              i.e. every cell is detected on its own
+    :param column_types: csv only. A dictionary of column index or column
+                         name to a type or a conversion function. Declared
+                         columns are not type detected
+    :param workers: csv files only. Parse the file in this many processes.
+                    Defaults to 1
+    :param use_mmap: csv file names only. Read the file through a read only
+                     memory map. Defaults to False
+    :param intern_strings: share equal strings within a column so that
+                           repeated values take memory only once.
+                           Defaults to False
+    :param intern_pool_size: the number of distinct strings a column can
+                             share before it gives up. Defaults to 1000
+    :param columns: a list of column indices, or of names in the first row,
+                    to pick in the given order instead of start_column and
+                    column_limit
+    :param row_filter: a function of the cells of a row, or a dictionary of
+                       column index or name to a function of a cell, that
+                       keeps the rows it returns True for. It sees the rows
+                       within start_row and row_limit, including the header
+                       row. csv readers give it the cells as text, before
+                       type detection
+    :param row_index_step: csv file names only. Keep the offset of every
+                           n-th record in file.csv.pyexcel-idx so that
+                           start_row seeks to the nearest one. Defaults
+                           to 0, i.e. no index
+    :param fast_split: csv only. Split the lines without quotes with
+                       str.split instead of csv.reader. Defaults to True
+    :param batch_size: gives lists of batch_size rows instead of rows
     :param keywords: any other library specific parameters
     :returns: an ordered dictionary
     """
@@ -56,6 +91,45 @@ def get_data(afile, file_type=None, streaming=None, **keywords):
     :param auto_detect_int: defaults to True
     :param auto_detect_datetime: defaults to True
     :param ignore_infinity: defaults to True
+    :param infer_sample_rows: csv only. Lock the type of each int, float or
+                              date column after looking at the first n
+                              rows. Defaults to 0,
+                              i.e. every cell is detected on its own
+    :param column_types: csv only. A dictionary of column index or column
+                         name to a type or a conversion function. Declared
+                         columns are not type detected
+    :param workers: csv files only. Parse the file in this many processes.
+                    Defaults to 1
+    :param use_mmap: csv file names only. Read the file through a read only
+                     memory map. Defaults to False
+    :param parallel_sheets: read this many sheets at the same time, each in
+                            its own process. Only for file names and
+                            picklable parameters. Defaults to 1
+    :param layout: 'rows', the default, gives a list of rows per sheet.
+                   'columns' gives a list of columns per sheet, in which
+                   a column of int is array('q'), a column of numbers is
+                   array('d') and the rest are lists. 'numpy' gives
+                   a numpy structured array per sheet, one field per column
+    :param intern_strings: share equal strings within a column so that
+                           repeated values take memory only once.
+                           Defaults to False
+    :param intern_pool_size: the number of distinct strings a column can
+                             share before it gives up. Defaults to 1000
+    :param columns: a list of column indices, or of names in the first row,
+                    to pick in the given order instead of start_column and
+                    column_limit
+    :param row_filter: a function of the cells of a row, or a dictionary of
+                       column index or name to a function of a cell, that
+                       keeps the rows it returns True for. It sees the rows
+                       within start_row and row_limit, including the header
+                       row. csv readers give it the cells as text, before
+                       type detection
+    :param row_index_step: csv file names only. Keep the offset of every
+                           n-th record in file.csv.pyexcel-idx so that
+                           start_row seeks to the nearest one. Defaults
+                           to 0, i.e. no index
+    :param fast_split: csv only. Split the lines without quotes with
+                       str.split instead of csv.reader. Defaults to True
     :param keywords: any other library specific parameters
     :returns: an ordered dictionary
     """
@@ -66,7 +140,73 @@ def get_data(afile, file_type=None, streaming=None, **keywords):
     return data
 
 
+def get_sheet_names(afile, file_type=None, **keywords):
+    """Get the sheet names of an excel file source
+
+    The book is opened but none of its sheets is read.
+
+    :param afile: a file name, a file stream or actual content
+    :param file_type: used only when filename is not a physial file name
+    :param library: explicitly name a library for use.
+                    e.g. library='pyexcel-ods'
+    :param keywords: any other library specific parameters
+    :returns: a list of sheet names
+    """
+    _update_source(afile, file_type, keywords)
+    reader = open_book(**keywords)
+    try:
+        return reader.get_sheet_names()
+    finally:
+        reader.close()
+
+
+def count_rows(afile, file_type=None, **keywords):
+    """Count the rows of each sheet in an excel file source
+
+    The csv formats count the records without parsing them. Other formats
+    read the sheets and count their rows.
+
+    :param afile: a file name, a file stream or actual content
+    :param file_type: used only when filename is not a physial file name
+    :param library: explicitly name a library for use.
+                    e.g. library='pyexcel-ods'
+    :param keywords: any other library specific parameters
+    :returns: an ordered dictionary of sheet names and their row counts
+    """
+    _update_source(afile, file_type, keywords)
+    reader = open_book(**keywords)
+    try:
+        return reader.count_rows()
+    finally:
+        reader.close()
+
+
+def get_dimensions(afile, file_type=None, **keywords):
+    """Get the number of rows and columns of each sheet in an excel file source
+
+    Trailing empty cells are not counted as columns.
+
+    :param afile: a file name, a file stream or actual content
+    :param file_type: used only when filename is not a physial file name
+    :param library: explicitly name a library for use.
+                    e.g. library='pyexcel-ods'
+    :param keywords: any other library specific parameters
+    :returns: an ordered dictionary of sheet names and (rows, columns)
+    """
+    _update_source(afile, file_type, keywords)
+    reader = open_book(**keywords)
+    try:
+        return reader.get_dimensions()
+    finally:
+        reader.close()
+
+
 def _get_data(afile, file_type=None, **keywords):
+    _update_source(afile, file_type, keywords)
+    return load_data(**keywords)
+
+
+def _update_source(afile, file_type, keywords):
     if isstream(afile):
         keywords.update(dict(
             file_stream=afile,
@@ -80,7 +220,6 @@ def _get_data(afile, file_type=None, **keywords):
             keywords.update(dict(
                 file_content=afile,
                 file_type=file_type))
-    return load_data(**keywords)
 
 
 def save_data(afile, data, file_type=None, **keywords):
@@ -93,6 +232,9 @@ def save_data(afile, data, file_type=None, **keywords):
     :param file_type: used only when filename is not a physial file name
     :param library: explicitly name a library for use.
                     e.g. library='pyexcel-ods'
+    :param parallel_sheets: csv files and csvz only. Write, or serialize,
+                            this many sheets at the same time in worker
+                            processes
     :param keywords: any other parameters that python csv module's
                      `fmtparams <https://docs.python.org/release/3.1.5/library/csv.html#dialects-and-formatting-parameters>`_
     """  # noqa
@@ -150,6 +292,8 @@ def load_data(file_name=None,
               sheets=None,
               library=None,
               streaming=False,
+              layout=constants.LAYOUT_ROWS,
+              parallel_sheets=1,
               **keywords):
     """Load data from any supported excel formats
 
@@ -157,9 +301,73 @@ def load_data(file_name=None,
     :param file_type: used only when filename is not a physial file name
     :param sheet_name: the name of the sheet to be loaded
     :param sheet_index: the index of the sheet to be loaded
+    :param layout: 'rows', 'columns' or 'numpy'. Used only when streaming
+                   is False
+    :param parallel_sheets: the number of processes that read sheets at
+                            the same time. Used only when streaming is False
     :param keywords: any other parameters
     """
     result = {}
+    if layout not in constants.LAYOUTS:
+        raise ValueError(constants.MESSAGE_UNKNOWN_LAYOUT % layout)
+    if layout != constants.LAYOUT_ROWS and keywords.get('batch_size'):
+        raise ValueError(constants.MESSAGE_BATCHES_IN_ROWS_ONLY)
+
+    reader = open_book(file_name=file_name, file_content=file_content,
+                       file_stream=file_stream, file_type=file_type,
+                       library=library, **keywords)
+    if streaming is False and parallel_sheets > 1 and file_name:
+        if sheet_name is None and sheet_index is None:
+            if sheets is None:
+                # the workers read the sheets, not this process
+                sheets = list(range(len(reader.get_sheet_names())))
+            if len(sheets) > 1 and _can_be_pickled(keywords):
+                reader.close()
+                keywords.update(dict(
+                    file_name=file_name, file_type=file_type,
+                    library=library, layout=layout))
+                result = _load_sheets_in_parallel(
+                    sheets, parallel_sheets, keywords)
+                return result, None
+    if sheet_name:
+        result = reader.read_sheet_by_name(sheet_name)
+    elif sheet_index is not None:
+        result = reader.read_sheet_by_index(sheet_index)
+    elif sheets is not None:
+        result = reader.read_many(sheets)
+    else:
+        result = reader.read_all()
+    if streaming is False:
+        for key in result.keys():
+            if layout == constants.LAYOUT_COLUMNS:
+                result[key] = to_columns(result[key])
+            elif layout == constants.LAYOUT_NUMPY:
+                # cells that the reader keeps as text stay as text
+                result[key] = to_numpy(
+                    result[key], numeric_text=not keywords.get(
+                        'auto_detect_float', True))
+            else:
+                result[key] = list(result[key])
+        reader.close()
+        reader = None
+
+    return result, reader
+
+
+def open_book(file_name=None,
+              file_content=None,
+              file_stream=None,
+              file_type=None,
+              library=None,
+              **keywords):
+    """Open a book reader of any supported excel formats
+
+    :param file_name: actual file name, a file stream or actual content
+    :param file_type: used only when filename is not a physial file name
+    :param library: explicitly name a library for use.
+    :param keywords: any other parameters
+    :returns: an opened book reader
+    """
     inputs = [file_name, file_content, file_stream]
     number_of_none_inputs = [x for x in inputs if x is not None]
     if len(number_of_none_inputs) != 1:
@@ -177,21 +385,42 @@ def load_data(file_name=None,
         reader.open_content(file_content, **keywords)
     elif file_stream:
         reader.open_stream(file_stream, **keywords)
-    if sheet_name:
-        result = reader.read_sheet_by_name(sheet_name)
-    elif sheet_index is not None:
-        result = reader.read_sheet_by_index(sheet_index)
-    elif sheets is not None:
-        result = reader.read_many(sheets)
-    else:
-        result = reader.read_all()
-    if streaming is False:
-        for key in result.keys():
-            result[key] = list(result[key])
-        reader.close()
-        reader = None
+    return reader
 
-    return result, reader
+
+def _load_sheets_in_parallel(sheets, parallel_sheets, keywords):
+    """
+    each sheet is loaded by a worker process, which opens the file itself
+
+    hence no more than parallel_sheets sheets are open at once
+    """
+    tasks = []
+    for sheet in sheets:
+        task = dict(keywords)
+        task['sheets'] = [sheet]
+        tasks.append(task)
+    result = OrderedDict()
+    pool = multiprocessing.Pool(min(parallel_sheets, len(tasks)))
+    try:
+        for sheet_data in pool.imap(_load_sheet, tasks):
+            result.update(sheet_data)
+    finally:
+        pool.terminate()
+        pool.join()
+    return result
+
+
+def _load_sheet(keywords):
+    result, _ = load_data(**keywords)
+    return result
+
+
+def _can_be_pickled(keywords):
+    try:
+        pickle.dumps(keywords)
+        return True
+    except Exception:
+        return False
 
 
 def get_writer(file_name=None, file_stream=None,
@@ -7,14 +7,21 @@
     :copyright: (c) 2014-2017 by Onni Software Ltd.
     :license: New BSD License, see LICENSE for more details
 """
+import io
 import re
 import os
 import csv
+import json
 import glob
+import mmap
 import codecs
+import multiprocessing
+from collections import deque
+from itertools import chain, islice
 
 from pyexcel_io.book import BookReader
 from pyexcel_io.sheet import SheetReader, NamedContent
+from pyexcel_io.utils import _index_filter
 import pyexcel_io._compact as compact
 import pyexcel_io.constants as constants
 import pyexcel_io.service as service
@@ -25,73 +32,566 @@ DEFAULT_SHEET_SEPARATOR_FORMATTER = '---%s---' % constants.DEFAULT_NAME + "%s"
 SEPARATOR_MATCHER = "---%s:(.*)---" % constants.DEFAULT_NAME
 DEFAULT_CSV_STREAM_FILE_FORMATTER = (
     "---%s:" % constants.DEFAULT_NAME + "%s---%s")
+SHEET_SEPARATOR = DEFAULT_SHEET_SEPARATOR_FORMATTER % ''
 DEFAULT_NEWLINE = '\r\n'
-BOM_LITTLE_ENDIAN = b'\xff\xfe'
-BOM_BIG_ENDIAN = b'\xfe\ff'
-LITTLE_ENDIAN = 0
-BIG_ENDIAN = 1
+# files are read in parallel in ranges of this many bytes
+CSV_RANGE_SIZE = 16 * 1024 * 1024
+CSV_SCAN_BLOCK_SIZE = 64 * 1024
+# memory mapped files are decoded in blocks of this many bytes
+MMAP_BLOCK_SIZE = 1024 * 1024
+# the row offsets of a csv file are kept next to it, in file.csv.pyexcel-idx
+ROW_INDEX_SUFFIX = '.pyexcel-idx'
 
 
 class CSVMemoryMapIterator(compact.Iterator):
     """
     Wrapper class for mmap object
 
-    mmap object does not handle encoding at all. This class
-    provide the necessary transcoding for utf-8, utf-16 and utf-32
+    mmap object does not handle encoding at all. This class decodes it
+    in blocks with the incremental decoder of the given encoding, hence
+    any codec, byte order mark and line ending works as in a text file.
     """
     def __init__(self, mmap_obj, encoding):
-        self.__mmap_obj = mmap_obj
-        self.__encoding = encoding
-        self.__count = 0
-        self.__endian = LITTLE_ENDIAN
-        if encoding == 'utf-8':
-            # ..\r\x00\n
-            # \x00\x..
-            self.__zeros_left_in_2_row = 0
-        elif encoding == 'utf-16':
-            # ..\r\x00\n
-            # \x00\x..
-            self.__zeros_left_in_2_row = 1
-        elif encoding == 'utf-32':
-            # \r\x00\x00\x00\n
-            # \x00\x00\x00\x..
-            self.__zeros_left_in_2_row = 3
-        elif encoding == 'utf-32-be' or encoding == 'utf-16-be':
-            self.__zeros_left_in_2_row = 0
-            self.__endian = BIG_ENDIAN
-        elif encoding == 'utf-32-le':
-            self.__zeros_left_in_2_row = 3
-            self.__endian = LITTLE_ENDIAN
-        elif encoding == 'utf-16-le':
-            self.__zeros_left_in_2_row = 1
-            self.__endian = LITTLE_ENDIAN
-        else:
-            raise Exception("Encoding %s is not supported" % encoding)
+        self.__lines = decode_lines(mmap_obj, encoding)
 
     def __iter__(self):
-        return self
+        # hand out the line iterator itself to save a call per line
+        return self.__lines
 
     def __next__(self):
-        line = self.__mmap_obj.readline()
-        if self.__count == 0:
-            utf_16_32 = (self.__encoding == 'utf-16' or
-                         self.__encoding == 'utf-32')
-            if utf_16_32:
-                bom_header = line[:2]
-                if bom_header == BOM_BIG_ENDIAN:
-                    self.__endian = BIG_ENDIAN
-        elif self.__endian == LITTLE_ENDIAN:
-            line = line[self.__zeros_left_in_2_row:]
-        if self.__endian == LITTLE_ENDIAN:
-            line = line.rstrip()
-        line = line.decode(self.__encoding)
-        self.__count += 1
-        if line == '':
-            raise StopIteration
-        if compact.PY2:
-            # python 2 requires utf-8 encoded string for reading
-            line = line.encode('utf-8')
-        return line
+        return next(self.__lines)
+
+
+class MemoryMappedFile(CSVMemoryMapIterator):
+    """
+    Iterate the lines of a file through a read only memory map
+    """
+    def __init__(self, file_name, encoding):
+        self.__file_handle = open(file_name, 'rb')
+        self.__mmap_obj = None
+        if os.fstat(self.__file_handle.fileno()).st_size > 0:
+            self.__mmap_obj = mmap.mmap(
+                self.__file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        # an empty file cannot be mapped
+        CSVMemoryMapIterator.__init__(
+            self, self.__mmap_obj or b'', encoding)
+
+    def close(self):
+        if self.__mmap_obj is not None:
+            self.__mmap_obj.close()
+            self.__mmap_obj = None
+        self.__file_handle.close()
+
+
+def decode_lines(buffer, encoding, block_size=None):
+    """
+    Decode a bytes alike buffer, e.g. mmap, block by block into lines
+
+    Line endings become '\n' the same way as in a file opened in text mode.
+    """
+    blocks = _decode_blocks(buffer, encoding, block_size or MMAP_BLOCK_SIZE)
+    if compact.PY2:
+        # python 2 requires utf-8 encoded string for reading
+        return (line.encode('utf-8')
+                for block in blocks
+                for line in io.StringIO(block, newline='\n'))
+    return chain.from_iterable(
+        io.StringIO(block, newline='\n') for block in blocks)
+
+
+def _decode_blocks(buffer, encoding, block_size, start=0, stop=None):
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True)
+    if stop is None:
+        stop = len(buffer)
+    tail = u''
+    for position in compact.irange(start, stop, block_size):
+        end = min(position + block_size, stop)
+        text = tail + decoder.decode(buffer[position:end], final=end == stop)
+        # only whole lines leave, the rest waits for the next block
+        cut = text.rfind(u'\n') + 1
+        tail = text[cut:]
+        if cut:
+            yield text[:cut]
+    if tail:
+        yield tail
+
+
+def decode_blocks(buffer, encoding, start=0, stop=None):
+    """
+    Decode a bytes alike buffer from start to stop into blocks of lines
+    """
+    blocks = _decode_blocks(buffer, encoding, MMAP_BLOCK_SIZE, start, stop)
+    if compact.PY2:
+        # python 2 requires utf-8 encoded string for reading
+        return (block.encode('utf-8') for block in blocks)
+    return blocks
+
+
+def encode_ascii(text, encoding):
+    """
+    Encode the text and the sheet separators, if the encoding writes them
+    as ascii does, otherwise return None
+    """
+    marker = DEFAULT_CSV_STREAM_FILE_FORMATTER % ('', text)
+    encoder = codecs.getincrementalencoder(encoding)()
+    # the first call may write a byte order mark
+    encoder.encode(u'')
+    if encoder.encode(marker) == marker.encode('latin-1'):
+        return text.encode('latin-1')
+    return None
+
+
+def read_blocks(file_stream, start=0, stop=None):
+    """
+    Read a seekable stream from start to stop block by block
+
+    The stream is seeked before each block, so that more than one range
+    of it can be read at the same time.
+    """
+    position = start
+    while stop is None or position < stop:
+        size = CSV_SCAN_BLOCK_SIZE
+        if stop is not None:
+            size = min(size, stop - position)
+        file_stream.seek(position)
+        block = file_stream.read(size)
+        if not block:
+            break
+        position += len(block)
+        yield block
+
+
+def split_records(blocks, line_terminator):
+    """
+    Split text blocks at the line terminator
+
+    yields the complete records of each block as a list
+    """
+    tail = None
+    for block in blocks:
+        if tail:
+            block = tail + block
+        records = block.split(line_terminator)
+        tail = records.pop()
+        yield records
+    if tail:
+        yield [tail]
+
+
+def iter_blocks(file_handle, block_size=None):
+    """
+    Read a file handle block by block from where it is
+    """
+    block_size = block_size or MMAP_BLOCK_SIZE
+    while True:
+        block = file_handle.read(block_size)
+        if not block:
+            break
+        yield block
+
+
+def count_records(blocks, quotechar=None, delimiter=','):
+    """
+    Count the csv records in blocks of text, or of bytes, by line feeds
+
+    A line feed in between quotes belongs to a cell. As csv.reader reads
+    them, a quote opens a quoted cell only at the start of a cell and is a
+    plain character anywhere else, e.g. 5" tall. A last record without a
+    line feed counts as well.
+
+    :returns: the number of records, or None if a carriage return is not
+              followed by a line feed, which csv.reader takes for a line
+              end as well
+    """
+    count = 0
+    in_quotes = False
+    last_block = None
+    for block, records, in_quotes in scan_records(
+            blocks, quotechar, delimiter):
+        if last_block is None:
+            newline = _same_type(u'\n', block)
+            carriage_return = _same_type(u'\r', block)
+            lone_carriage_return = re.compile(_same_type(u'\r[^\n]', block))
+        elif last_block.endswith(carriage_return) and not block.startswith(
+                newline):
+            return None
+        if carriage_return in block and lone_carriage_return.search(block):
+            return None
+        count += records
+        last_block = block
+    if last_block is None:
+        return count
+    if last_block.endswith(carriage_return):
+        return None
+    if in_quotes or not last_block.endswith(newline):
+        # csv.reader gives an unclosed quoted cell as a record too
+        count += 1
+    return count
+
+
+def scan_records(blocks, quotechar=None, delimiter=','):
+    """
+    Go through blocks of text, or of bytes, as csv.reader reads them
+
+    A block whose quotes all open or close a cell, as csv.writer writes
+    them, is counted in one go. The other blocks are read quote by quote.
+
+    :returns: a generator of the block, the number of line feeds outside
+              quotes in it and whether the block ends in quotes, for each
+              block that is not empty
+    """
+    in_quotes = False
+    # a quote that ends a block in quotes may be doubled by the next block
+    quote_ends_block = False
+    newline = quote = separators = misplaced_quote = last_block = None
+    for block in blocks:
+        if not block:
+            continue
+        if newline is None:
+            newline = _same_type(u'\n', block)
+            quote = quotechar and _same_type(quotechar, block)
+            separators = (newline, _same_type(u'\r', block),
+                          _same_type(delimiter, block))
+            if quote:
+                misplaced_quote = _make_misplaced_quote_pattern(
+                    quote, separators)
+        count = 0
+        if quote and (in_quotes or quote in block):
+            counted = None
+            if not block.endswith(quote) and not (
+                    last_block and last_block.endswith(quote)):
+                counted = _count_outside_quotes(
+                    block, quote, in_quotes,
+                    last_block[-1:] if last_block else newline,
+                    misplaced_quote)
+            if counted is not None:
+                count, in_quotes = counted
+                last_block = block
+                yield block, count, in_quotes
+                continue
+            position = 0
+            length = len(block)
+            if quote_ends_block:
+                quote_ends_block = False
+                if block[:1] == quote:
+                    position = 1
+                else:
+                    in_quotes = False
+            while position < length:
+                found = block.find(quote, position)
+                if in_quotes:
+                    if found == -1:
+                        break
+                    elif found + 1 == length:
+                        quote_ends_block = True
+                    elif block[found + 1:found + 2] == quote:
+                        found += 1
+                    else:
+                        in_quotes = False
+                else:
+                    if found == -1:
+                        count += block.count(newline, position)
+                        break
+                    count += block.count(newline, position, found)
+                    if found == 0:
+                        before = last_block and last_block[-1:]
+                    else:
+                        before = block[found - 1:found]
+                    in_quotes = not before or before in separators
+                position = found + 1
+        else:
+            count = block.count(newline)
+        last_block = block
+        # unless the next block doubles it, a last quote closes its cell
+        yield block, count, in_quotes and not quote_ends_block
+
+
+def _make_misplaced_quote_pattern(quote, separators):
+    """
+    a quote, in a block where the quoted parts are replaced by quotes,
+    that is followed by neither a separator nor a quote
+
+    The pattern starts with the quote, so that it is searched quickly. The
+    characters before the quotes are checked in the reversed block.
+    """
+    characters = [character.decode('latin-1')
+                  if isinstance(character, bytes) else character
+                  for character in separators + (quote,)]
+    allowed = u''.join(re.escape(character) for character in characters)
+    pattern = u'%s[^%s]' % (re.escape(characters[-1]), allowed)
+    return re.compile(_same_type(pattern, quote))
+
+
+def _count_outside_quotes(block, quote, in_quotes, before,
+                          misplaced_quote):
+    """
+    count the line feeds outside quotes in a block, if every quote opens or
+    closes a quoted cell as the count of quotes before it says
+
+    :returns: the count and whether the block ends in quotes, or None
+    """
+    segments = block.split(quote)
+    outside_quotes = quote.join(segments[int(in_quotes)::2])
+    ends_in_quotes = in_quotes != (len(segments) % 2 == 0)
+    # the quotes left stand for the quoted parts, including the ones that
+    # the block starts in and ends in
+    checked = (quote if in_quotes else before) + outside_quotes
+    if ends_in_quotes:
+        checked += quote
+    if misplaced_quote.search(checked) or misplaced_quote.search(
+            checked[::-1]):
+        return None
+    return outside_quotes.count(_same_type(u'\n', block)), ends_in_quotes
+
+
+def index_records(blocks, step, encoding='utf-8', csv_keywords=None):
+    """
+    Find the offsets of every step-th record in blocks of bytes
+
+    The records are parsed by csv.reader, as the rows are read, hence a
+    quote in the middle of a cell is a plain character here as well. The
+    offset of a record is known when csv.reader has taken the lines of the
+    records before it.
+
+    :param encoding: an encoding that writes line feeds as latin-1 does
+    :returns: the offsets of records 0, step, 2 * step and so on, or only
+              the offset of record 0 if a lone carriage return, which ends
+              a line in text mode, hides the line ends from the offsets
+    """
+    offsets = [0]
+    line_end = [0]
+    lines = _track_lines(blocks, encoding, line_end)
+    try:
+        for count, _ in enumerate(
+                csv.reader(lines, **(csv_keywords or {})), 1):
+            if count % step == 0:
+                offsets.append(line_end[0])
+    except (csv.Error, _LoneCarriageReturn):
+        return [0]
+    return offsets
+
+
+class _LoneCarriageReturn(Exception):
+    pass
+
+
+def _track_lines(blocks, encoding, line_end):
+    """
+    decode the lines of blocks of bytes as a text file in universal newline
+    mode does, keeping the offset of the end of the last line in line_end
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for line in _split_byte_lines(blocks):
+        line_end[0] += len(line)
+        text = decoder.decode(line)
+        if text.endswith(u'\r\n'):
+            text = text[:-2] + u'\n'
+        if u'\r' in text:
+            raise _LoneCarriageReturn()
+        yield text
+
+
+def _split_byte_lines(blocks):
+    tail = b''
+    for block in blocks:
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        tail = block[cut:]
+        for line in io.BytesIO(block[:cut]):
+            yield line
+    if tail:
+        yield tail
+
+
+def load_row_index(file_name, step, encoding='utf-8', csv_keywords=None):
+    """
+    the offsets of every step-th record of a csv file, via its sidecar
+
+    The sidecar is built when it is missing, or when the size or the
+    modification time of the file has changed since, or when it was
+    built for another step, encoding or csv dialect.
+    """
+    stat = os.stat(file_name)
+    dialect = csv.reader([], **(csv_keywords or {})).dialect
+    index = dict(size=stat.st_size, mtime=stat.st_mtime, step=step,
+                 encoding=encoding,
+                 dialect=[dialect.delimiter, dialect.quotechar,
+                          dialect.quoting, dialect.doublequote,
+                          dialect.skipinitialspace, dialect.strict])
+    index_file_name = file_name + ROW_INDEX_SUFFIX
+    try:
+        with open(index_file_name, 'r') as index_file:
+            saved_index = json.load(index_file)
+        if isinstance(saved_index, dict) and all(
+                saved_index.get(key) == value
+                for key, value in index.items()):
+            return saved_index['offsets']
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+    index['offsets'] = index_records(
+        _read_file_blocks(file_name), step, encoding, csv_keywords)
+    try:
+        with open(index_file_name, 'w') as index_file:
+            json.dump(index, index_file)
+    except (IOError, OSError):
+        # e.g. a read only folder, then the index lives as long as the read
+        pass
+    return index['offsets']
+
+
+def split_rows(file_handle, delimiter, quotechar, csv_keywords):
+    """
+    Tokenize a csv text stream by str.split, as long as it has no quotes
+
+    The stream is read in blocks of text. Once a block has a quote, the
+    rest of the stream, from the start of its first unfinished line, goes
+    through csv.reader with csv_keywords.
+
+    :param quotechar: None if nothing is quoted
+    :returns: an iterator of rows, as csv.reader gives
+    """
+    return chain.from_iterable(
+        _split_blocks(file_handle, delimiter, quotechar, csv_keywords))
+
+
+def _split_blocks(file_handle, delimiter, quotechar, csv_keywords):
+    tail = ''
+    while True:
+        block = file_handle.read(MMAP_BLOCK_SIZE)
+        if not block:
+            break
+        text = tail + block
+        if quotechar and quotechar in block:
+            while text.endswith('\r'):
+                # a line feed may come next
+                character = file_handle.read(1)
+                text += character
+                if character != '\r':
+                    break
+            if not text.endswith(('\n', '\r')):
+                text += file_handle.readline()
+            lines = chain(io.StringIO(text, newline=''), file_handle)
+            yield csv.reader(lines, **csv_keywords)
+            return
+        carriage_return = ''
+        if '\r' in text:
+            if text.endswith('\r'):
+                # a line feed may come with the next block
+                text, carriage_return = text[:-1], '\r'
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = text.split('\n')
+        tail = lines.pop() + carriage_return
+        rows = [line.split(delimiter) for line in lines]
+        if '' in lines:
+            # csv.reader gives an empty list for a blank line
+            rows = [row if row != [''] else [] for row in rows]
+        yield rows
+    if tail == '\r':
+        yield [[]]
+    elif tail:
+        yield [tail.rstrip('\r').split(delimiter)]
+
+
+def _same_type(text, block):
+    if isinstance(block, bytes) and not isinstance(text, bytes):
+        return text.encode('latin-1')
+    return text
+
+
+def index_sheets(blocks, line_terminator):
+    """
+    Find the name, start and stop of each sheet in a multi-sheet csv stream
+
+    The blocks are searched once for the lines of sheet headers and sheet
+    separators. The start and stop positions of the sheet content count
+    the characters, or the bytes, of the blocks.
+    """
+    prefix = SHEET_SEPARATOR[:-3]
+    header = re.compile(constants.SEPARATOR_MATCHER)
+    separator = SHEET_SEPARATOR
+    if isinstance(line_terminator, bytes) and not compact.PY2:
+        prefix = prefix.encode('latin-1')
+        header = re.compile(constants.SEPARATOR_MATCHER.encode('latin-1'))
+        separator = separator.encode('latin-1')
+    sheets = []
+    name = start = tail = None
+    position = padding = 0
+    for block in chain(blocks, [None]):
+        if block is None:
+            if not tail:
+                break
+            # the last line may not have a line terminator
+            padding = len(line_terminator)
+            text = tail + line_terminator
+            cut = len(text)
+        else:
+            text = tail + block if tail else block
+            cut = text.rfind(line_terminator)
+            if cut < 0:
+                tail = text
+                continue
+            cut += len(line_terminator)
+        for line_start, line_end in _find_lines(
+                text, cut, prefix, line_terminator):
+            line = text[line_start:line_end]
+            if name is None:
+                result = header.match(line)
+                if result:
+                    name = result.group(1)
+                    start = position + line_end + len(line_terminator)
+            elif line == separator:
+                sheets.append((name, start, position + line_start))
+                name = None
+        tail = text[cut:]
+        position += cut
+    if name is not None:
+        stop = position - padding
+        sheets.append((name, start, max(start, stop)))
+    return sheets
+
+
+def _find_lines(text, stop, prefix, line_terminator):
+    """
+    yield the start and the end of the lines in text[:stop] that begin
+    with prefix. text starts at the start of a line and stops at the end
+    of one
+    """
+    if text.startswith(prefix):
+        yield 0, text.find(line_terminator, 0, stop)
+    marker = line_terminator + prefix
+    found = text.find(marker, 0, stop)
+    while found != -1:
+        line_start = found + len(line_terminator)
+        line_end = text.find(line_terminator, line_start, stop)
+        yield line_start, line_end
+        found = text.find(marker, line_end, stop)
+
+
+def sheet_lines(blocks, line_terminator):
+    """
+    Turn the text blocks of a sheet into lines for csv.reader
+    """
+    return chain.from_iterable(
+        _split_lines(_join_records(records))
+        for records in split_records(blocks, line_terminator) if records)
+
+
+def _join_records(records):
+    return '\n'.join(records) + '\n'
+
+
+def _split_lines(text):
+    if compact.PY2:
+        return compact.StringIO(text)
+    return io.StringIO(text, newline='\n')
+
+
+class HeaderRow(list):
+    """
+    the cells of a header row, which are not given to declared converters
+    """
+    pass
 
 
 class UTF8Recorder(compact.Iterator):
@@ -119,48 +619,251 @@ class CSVSheetReader(SheetReader):
     def __init__(self, sheet, encoding="utf-8",
                  auto_detect_float=True, ignore_infinity=True,
                  auto_detect_int=True, auto_detect_datetime=True,
+                 infer_sample_rows=0, column_types=None, workers=1,
+                 use_mmap=False, row_index_step=0, fast_split=True,
                  **keywords):
         SheetReader.__init__(self, sheet, **keywords)
         self._encoding = encoding
-        self.__auto_detect_int = auto_detect_int
-        self.__auto_detect_float = auto_detect_float
-        self.__ignore_infinity = ignore_infinity
-        self.__auto_detect_datetime = auto_detect_datetime
+        self._fast_split = fast_split
+        self._workers = workers
+        self._use_mmap = use_mmap
+        self._row_index_step = row_index_step
+        self._cell_detection = dict(
+            auto_detect_int=auto_detect_int,
+            auto_detect_float=auto_detect_float,
+            auto_detect_datetime=auto_detect_datetime,
+            ignore_infinity=ignore_infinity)
+        self.__convert_cell = service.make_cell_converter(
+            auto_detect_int=auto_detect_int,
+            auto_detect_float=auto_detect_float,
+            auto_detect_datetime=auto_detect_datetime,
+            ignore_infinity=ignore_infinity)
+        self.__infer_sample_rows = infer_sample_rows
+        self.__column_types = column_types or {}
+        self.__column_converters = []
+        self.inferred_column_types = {}
         self.__file_handle = None
 
     def get_file_handle(self):
         """ return me unicde reader for csv """
         raise NotImplementedError("Please implement get_file_handle()")
 
+    def has_column_converters(self):
+        """tell if the columns are converted by their own types"""
+        return self.__infer_sample_rows > 0 or bool(self.__column_types)
+
+    def get_dialect(self):
+        """the csv dialect made of the csv keywords"""
+        return csv.reader([], **self._keywords).dialect
+
+    def count_rows(self):
+        """
+        count the records by their line feeds, without parsing them
+        """
+        dialect = self.get_dialect()
+        if dialect.escapechar or dialect.skipinitialspace:
+            # an escaped quote, or a quote after spaces, would be taken
+            # for a plain character
+            return SheetReader.count_rows(self)
+        payload = self._native_sheet.payload
+        position = None
+        if hasattr(payload, 'seek'):
+            position = payload.tell()
+        rows = count_records(self._get_blocks(), get_quotechar(dialect),
+                             dialect.delimiter)
+        if rows is None:
+            # lone carriage returns are left to csv.reader
+            if position is not None:
+                payload.seek(position)
+            rows = SheetReader.count_rows(self)
+        return rows
+
+    def get_dimensions(self):
+        rows = columns = 0
+        # the records are told apart as they are read, e.g. at lone
+        # carriage returns too
+        for row in CSVSheetReader.row_iterator(self):
+            rows += 1
+            length = len(row)
+            while length and row[length - 1] == '':
+                length -= 1
+            if length > columns:
+                columns = length
+        return rows, columns
+
+    def _get_blocks(self):
+        """
+        the content in blocks of text, or in lines
+        """
+        self.__file_handle = self.get_file_handle()
+        if hasattr(self.__file_handle, 'read'):
+            return iter_blocks(self.__file_handle)
+        return self.__file_handle
+
     def row_iterator(self):
         self.__file_handle = self.get_file_handle()
-        return csv.reader(self.__file_handle, **self._keywords)
+        dialect = self.get_dialect()
+        if self.__can_split(dialect):
+            rows = split_rows(self.__file_handle, dialect.delimiter,
+                              get_quotechar(dialect), self._keywords)
+        else:
+            rows = csv.reader(self.__file_handle, **self._keywords)
+        if self.__infer_sample_rows > 0 or self.__column_types:
+            rows = self.__prepare_column_converters(rows)
+        return rows
+
+    def __can_split(self, dialect):
+        """tell if a text stream can be tokenized by str.split"""
+        return (self._fast_split and not compact.PY2 and
+                hasattr(self.__file_handle, 'read') and
+                not dialect.escapechar and
+                not dialect.skipinitialspace and
+                dialect.quoting != csv.QUOTE_NONNUMERIC)
 
     def column_iterator(self, row):
-        for element in row:
-            if compact.PY2:
-                element = element.decode('utf-8')
+        converters = self.__converters_of(row)
+        number_of_converters = len(converters)
+        if compact.PY2:
+            row = self.__decode(row)
+        for index, element in enumerate(row):
             if element is not None and element != '':
-                element = self.__convert_cell(element)
+                if index < number_of_converters:
+                    element = converters[index](element)
+                else:
+                    element = self.__convert_cell(element)
             yield element
 
-    def __convert_cell(self, csv_cell_text):
-        ret = None
-        if self.__auto_detect_int:
-            ret = service.detect_int_value(csv_cell_text)
-        if ret is None and self.__auto_detect_float:
-            ret = service.detect_float_value(csv_cell_text)
-            shall_we_ignore_the_conversion = (
-                (ret in [float('inf'), float('-inf')]) and
-                self.__ignore_infinity
-            )
-            if shall_we_ignore_the_conversion:
-                ret = None
-        if ret is None and self.__auto_detect_datetime:
-            ret = service.detect_date_value(csv_cell_text)
-        if ret is None:
-            ret = csv_cell_text
-        return ret
+    def row_values(self, row):
+        return self._row_values(row, slice(0, None))
+
+    def _row_values(self, row, column_window):
+        converters = self.__converters_of(row)
+        number_of_converters = len(converters)
+        convert_cell = self.__convert_cell
+        cells = row[column_window]
+        if compact.PY2:
+            cells = [cell.decode('utf-8') for cell in cells]
+        if number_of_converters == 0:
+            return [convert_cell(cell) if cell != '' else cell
+                    for cell in cells]
+        return [(converters[index] if index < number_of_converters
+                 else convert_cell)(cell) if cell != '' else cell
+                for index, cell in enumerate(cells, column_window.start)]
+
+    def _batch_values(self, rows, column_window):
+        if compact.PY2 or self.__column_converters:
+            row_values = self._row_values
+            return [row_values(row, column_window) for row in rows]
+        convert_cell = self.__convert_cell
+        return [[convert_cell(cell) if cell != '' else cell
+                 for cell in row[column_window]]
+                for row in rows]
+
+    def _apply_to_cells(self, row_filter):
+        # the tokenized cells are seen before any conversion
+        if compact.PY2:
+            return lambda row: row_filter(self.__decode(row))
+        return row_filter
+
+    def _select_values(self, row, column_indices):
+        converters = self.__converters_of(row)
+        number_of_converters = len(converters)
+        convert_cell = self.__convert_cell
+        length = len(row)
+        values = []
+        for index in column_indices:
+            if index >= length:
+                values.append('')
+                continue
+            cell = row[index]
+            if compact.PY2:
+                cell = cell.decode('utf-8')
+            if cell != '':
+                if index < number_of_converters:
+                    cell = converters[index](cell)
+                else:
+                    cell = convert_cell(cell)
+            values.append(cell)
+        return values
+
+    def __prepare_column_converters(self, rows):
+        """
+        work out one converter per column before the rows are converted
+
+        declared column types win over the inferred ones. When a column
+        is declared by its name, the first row is taken as the header.
+        """
+        has_header = any(compact.is_string(type(key))
+                         for key in self.__column_types)
+        head = list(islice(rows, self._start_row + self.__infer_sample_rows))
+        if has_header and not head:
+            head = list(islice(rows, 1))
+        converters = []
+        if self.__infer_sample_rows > 0:
+            # rows before start_row, e.g. the header, are not sampled
+            converters = self.__lock_column_types(head[self._start_row:])
+        if self.__column_types:
+            header = []
+            if has_header and head:
+                header = self.__decode(head[0])
+            for key, column_type in self.__column_types.items():
+                if compact.is_string(type(key)):
+                    if key not in header:
+                        raise ValueError("Cannot find column %s" % key)
+                    index = header.index(key)
+                else:
+                    index = key
+                while len(converters) <= index:
+                    converters.append(self.__convert_cell)
+                converters[index] = service.make_declared_converter(
+                    column_type)
+        self.__column_converters = converters
+        if has_header and head:
+            head[0] = HeaderRow(head[0])
+        return chain(head, rows)
+
+    def __converters_of(self, row):
+        """the header goes through the usual detection"""
+        if type(row) is HeaderRow:
+            return []
+        return self.__column_converters
+
+    def __lock_column_types(self, sample):
+        """
+        infer column types from the sample rows
+
+        afterwards, each int, float or date column gets a converter for
+        its own type and only the cells that do not fit go through the
+        full detection. Text columns are detected cell by cell. When
+        start_row is 0, a text cell in the first row is taken as a header
+        and does not count.
+        """
+        number_of_columns = max([len(row) for row in sample] + [0])
+        header = []
+        if self._start_row == 0 and sample:
+            header, sample = sample[0], sample[1:]
+        converters = []
+        for index in compact.irange(number_of_columns):
+            cells = self.__decode([row[index] for row in sample
+                                   if index < len(row) and row[index] != ''])
+            values = [self.__convert_cell(cell) for cell in cells]
+            if index < len(header) and header[index] != '':
+                value = self.__convert_cell(self.__decode([header[index]])[0])
+                if not compact.is_string(type(value)):
+                    values.append(value)
+            column_type = service.detect_column_type(values)
+            if column_type not in service.LOCKED_COLUMN_TYPES:
+                column_type = None
+            if column_type is not None:
+                self.inferred_column_types[index] = column_type
+            converters.append(service.make_locked_converter(
+                column_type, self.__convert_cell))
+        return converters
+
+    def __decode(self, cells):
+        if compact.PY2:
+            cells = [cell.decode('utf-8') for cell in cells]
+        return cells
 
     def close(self):
         if self.__file_handle:
@@ -171,9 +874,166 @@ class CSVSheetReader(SheetReader):
 
 class CSVFileReader(CSVSheetReader):
     """ read csv from phyical file """
+    def __init__(self, sheet, **keywords):
+        CSVSheetReader.__init__(self, sheet, **keywords)
+        self.__rows_are_converted = False
+        self.__pool = None
+        self.__offset = 0
+
+    def row_iterator(self):
+        if self.__can_read_in_parallel():
+            self.__rows_are_converted = True
+            return self.__read_in_parallel()
+        self.__offset = self._first_row = 0
+        if self.__can_seek():
+            self.__seek_start_row()
+        rows = CSVSheetReader.row_iterator(self)
+        # a book of many csv files does not keep them all open
+        return chain(rows, self.__close_at_the_end())
+
+    def __close_at_the_end(self):
+        """close the file once all rows are read and yield nothing"""
+        self.close()
+        return
+        yield
+
+    def column_iterator(self, row):
+        if self.__rows_are_converted:
+            return iter(row)
+        return CSVSheetReader.column_iterator(self, row)
+
+    def _row_values(self, row, column_window):
+        if self.__rows_are_converted:
+            return row[column_window]
+        return CSVSheetReader._row_values(self, row, column_window)
+
+    def _batch_values(self, rows, column_window):
+        if self.__rows_are_converted:
+            return [row[column_window] for row in rows]
+        return CSVSheetReader._batch_values(self, rows, column_window)
+
+    def _select_values(self, row, column_indices):
+        if self.__rows_are_converted:
+            length = len(row)
+            return [row[index] if index < length else ''
+                    for index in column_indices]
+        return CSVSheetReader._select_values(self, row, column_indices)
+
+    def __can_read_in_parallel(self):
+        """
+        ranges of bytes can be parsed on their own only if line feeds,
+        quotes and delimiters are single bytes, quotes are not escaped and
+        the spaces after delimiters are kept, as for count_records
+        """
+        if self._workers < 2 or compact.PY2 or self.has_column_converters():
+            return False
+        if self._row_filter is not None:
+            # the filter is given the cells as text, before conversion
+            return False
+        if os.path.getsize(self._native_sheet.payload) <= CSV_RANGE_SIZE:
+            return False
+        dialect = self.get_dialect()
+        if dialect.escapechar or dialect.skipinitialspace:
+            return False
+        return self.__has_single_byte_specials(dialect.delimiter)
+
+    def __can_seek(self):
+        """
+        the rows before start_row can be skipped by the row index, if the
+        records can be told apart in bytes, as in __can_read_in_parallel
+        """
+        if self._row_index_step < 1 or compact.PY2:
+            return False
+        if self._start_row < self._row_index_step:
+            return False
+        if self._skip_row is not _index_filter or self._has_column_names():
+            # the header would be skipped
+            return False
+        if self.has_column_converters() or self.get_dialect().escapechar:
+            return False
+        return self.__has_single_byte_specials()
+
+    def __seek_start_row(self):
+        """
+        start from the nearest indexed record at or before start_row
+        """
+        offsets = load_row_index(self._native_sheet.payload,
+                                 self._row_index_step, self._encoding,
+                                 self._keywords)
+        index = min(self._start_row // self._row_index_step,
+                    len(offsets) - 1)
+        self.__offset = offsets[index]
+        self._first_row = index * self._row_index_step
+
+    def __has_single_byte_specials(self, other_characters=''):
+        """
+        tell if line feeds and quotes, and the other characters, are
+        written as latin-1 does
+        """
+        special_characters = '\n' + (self.__quotechar() or '')
+        special_characters += other_characters
+        try:
+            encoder = codecs.getincrementalencoder(self._encoding)()
+            # byte order marks, if any, come with the first call
+            encoder.encode('\n')
+            encoded = encoder.encode(special_characters)
+            return encoded == special_characters.encode('latin-1')
+        except (LookupError, UnicodeError):
+            return False
+
+    def __quotechar(self):
+        return get_quotechar(self.get_dialect())
+
+    def _get_blocks(self):
+        if self.__has_single_byte_specials(self.get_dialect().delimiter):
+            # no need to decode the file to count its line feeds
+            return _read_file_blocks(self._native_sheet.payload)
+        return CSVSheetReader._get_blocks(self)
+
+    def __read_in_parallel(self):
+        file_name = self._native_sheet.payload
+        quotechar = self.__quotechar()
+        if quotechar:
+            quotechar = quotechar.encode('latin-1')
+        delimiter = self.get_dialect().delimiter.encode('latin-1')
+        self.__pool = multiprocessing.Pool(self._workers)
+        pending = deque()
+        try:
+            for start, stop in split_csv_file(
+                    file_name, CSV_RANGE_SIZE, quotechar, delimiter):
+                task = (file_name, start, stop, self._encoding,
+                        self._keywords, self._cell_detection,
+                        self._use_mmap)
+                pending.append(
+                    self.__pool.apply_async(read_csv_range, (task,)))
+                # keep the workers busy but not too far ahead
+                if len(pending) >= 2 * self._workers:
+                    for row in pending.popleft().get():
+                        yield row
+            while pending:
+                for row in pending.popleft().get():
+                    yield row
+        finally:
+            self.close()
+
+    def close(self):
+        if self.__pool:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+        CSVSheetReader.close(self)
+
     def get_file_handle(self):
         unicode_reader = None
-        if compact.PY2:
+        if self.__offset:
+            file_handle = open(self._native_sheet.payload, 'rb')
+            file_handle.seek(self.__offset)
+            unicode_reader = io.TextIOWrapper(file_handle,
+                                              encoding=self._encoding)
+        elif self._use_mmap:
+            unicode_reader = MemoryMappedFile(
+                self._native_sheet.payload, self._encoding)
+        elif compact.PY2:
             file_handle = open(self._native_sheet.payload, 'rb')
             unicode_reader = UTF8Recorder(file_handle, self._encoding)
         else:
@@ -182,6 +1042,81 @@ class CSVFileReader(CSVSheetReader):
         return unicode_reader
 
 
+def get_quotechar(dialect):
+    """
+    the quote of a csv dialect, None if nothing is quoted
+    """
+    if dialect.quoting == csv.QUOTE_NONE:
+        return None
+    return dialect.quotechar
+
+
+def _read_file_blocks(file_name):
+    with open(file_name, 'rb') as file_handle:
+        for block in iter_blocks(file_handle):
+            yield block
+
+
+def split_csv_file(file_name, range_size, quotechar, delimiter=b','):
+    """
+    Cut a csv file into ranges of bytes, each of which holds whole records
+
+    A range ends at the first line feed after range_size bytes that is
+    not in between quotes. The quotes are followed from the start of
+    each range as count_records does, hence a quote in the middle of a
+    cell, e.g. 5" tall, is a plain character here as well.
+
+    :param quotechar: the quote in bytes, None if nothing is quoted
+    :param delimiter: the delimiter in bytes
+    :returns: a generator of (start, stop) offsets
+    """
+    size = os.path.getsize(file_name)
+    with open(file_name, 'rb') as file_handle:
+        start = 0
+        while start < size:
+            if start + range_size >= size:
+                yield start, size
+                break
+            file_handle.seek(start)
+            # the range in one block, then line by line until a record ends
+            blocks = chain([file_handle.read(range_size)], file_handle)
+            stop = start
+            for block, _, in_quotes in scan_records(
+                    blocks, quotechar, delimiter):
+                stop += len(block)
+                if not in_quotes and block.endswith(b'\n'):
+                    break
+            yield start, stop
+            start = stop
+
+
+def read_csv_range(task):
+    """
+    parse and convert the rows in a range of bytes in a csv file
+
+    it is run in worker processes, hence every argument is picklable
+    """
+    (file_name, start, stop, encoding, csv_keywords, cell_detection,
+     use_mmap) = task
+    with open(file_name, 'rb') as file_handle:
+        if use_mmap:
+            # read only maps of all workers share the same pages
+            mmap_obj = mmap.mmap(
+                file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            content = mmap_obj[start:stop]
+            mmap_obj.close()
+        else:
+            file_handle.seek(start)
+            content = file_handle.read(stop - start)
+    content = content.decode(encoding)
+    # the same newline translation as open(file_name, 'r') does
+    rows = csv.reader(compact.StringIO(content, newline=None),
+                      **csv_keywords)
+    convert_cell = service.make_cell_converter(**cell_detection)
+    return [[convert_cell(cell) if cell != '' else cell for cell in row]
+            for row in rows]
+
+
 class CSVinMemoryReader(CSVSheetReader):
     """ read csv file from memory """
     def get_file_handle(self):
@@ -207,6 +1142,125 @@ class CSVinMemoryReader(CSVSheetReader):
         return unicode_reader
 
 
+class PendingSheet(deque):
+    """
+    The text of a sheet in a stream that is scanned but not yet read
+    """
+    def __init__(self):
+        deque.__init__(self)
+        self.complete = False
+        self.dropped = False
+
+    def push(self, records):
+        if records and not self.dropped:
+            self.append(_join_records(records))
+
+    def drop(self):
+        self.clear()
+        self.dropped = True
+
+
+class CSVSheetStream(object):
+    """
+    Split a stream of many csv sheets into sheets in one pass
+
+    The text of a sheet waits in its queue only until it is read. When
+    the sheets are read one after another, about one block of the stream
+    is held in memory. A sheet that is passed over before it is read keeps
+    its text until then.
+    """
+    def __init__(self, blocks, line_terminator):
+        self.__blocks = split_records(blocks, line_terminator)
+        self.__sheets = []
+        self.__current = None
+        self.__finished = False
+
+    def __iter__(self):
+        for sheet, _ in self.__scanned_sheets():
+            yield sheet
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def get_sheet_names(self):
+        """
+        scan all sheets for their names and drop their records
+        """
+        names = []
+        for sheet, pending in self.__scanned_sheets():
+            pending.drop()
+            names.append(sheet.name)
+        return names
+
+    def select(self, sheets):
+        """
+        find the sheets by index or by name and drop the rest
+
+        returns a dictionary of the found sheets. Scanning stops as soon as
+        all of them are found.
+        """
+        wanted = set(sheets)
+        found = {}
+        for index, (sheet, pending) in enumerate(self.__scanned_sheets()):
+            keys = [key for key in (index, sheet.name)
+                    if key in wanted and key not in found]
+            for key in keys:
+                found[key] = sheet
+            if not keys:
+                pending.drop()
+            if len(found) == len(wanted):
+                break
+        return found
+
+    def __scanned_sheets(self):
+        index = 0
+        while True:
+            while index >= len(self.__sheets):
+                if self.__finished:
+                    return
+                self.__scan()
+            yield self.__sheets[index]
+            index += 1
+
+    def __scan(self):
+        """
+        read one block from the stream and file its records
+        """
+        try:
+            records = next(self.__blocks)
+        except StopIteration:
+            self.__finished = True
+            records = [SHEET_SEPARATOR]
+        current = self.__current
+        content = []
+        for record in records:
+            if current is None:
+                result = re.match(constants.SEPARATOR_MATCHER, record)
+                if result:
+                    current = PendingSheet()
+                    lines = chain.from_iterable(
+                        _split_lines(text) for text in self.__read(current))
+                    self.__sheets.append(
+                        (NamedContent(result.group(1), lines), current))
+            elif record == SHEET_SEPARATOR:
+                current.push(content)
+                current.complete = True
+                current = None
+                content = []
+            else:
+                content.append(record)
+        if current is not None:
+            current.push(content)
+        self.__current = current
+
+    def __read(self, pending):
+        while pending or not pending.complete:
+            if pending:
+                yield pending.popleft()
+            else:
+                self.__scan()
+
+
 class CSVBookReader(BookReader):
     """ read csv file """
     def __init__(self):
@@ -219,6 +1273,7 @@ class CSVBookReader(BookReader):
         self.__sheet_index = None
         self.__multiple_sheets = False
         self.__readers = []
+        self.inferred_column_types = compact.OrderedDict()
 
     def open(self, file_name, **keywords):
         BookReader.open(self, file_name, **keywords)
@@ -235,7 +1290,9 @@ class CSVBookReader(BookReader):
             encoding = keywords.get('encoding', 'utf-8')
             if isinstance(file_content, mmap.mmap):
                 # load from mmap
-                self.__multiple_sheets = keywords.get('multiple_sheets', False)
+                self.__multiple_sheets = keywords.pop(
+                    'multiple_sheets', False)
+                self._file_content = file_content
                 self._file_stream = CSVMemoryMapIterator(
                     file_content, encoding)
                 self._keywords = keywords
@@ -251,13 +1308,68 @@ class CSVBookReader(BookReader):
             BookReader.open_content(
                 self, file_content, **keywords)
 
+    def get_sheet_names(self):
+        if isinstance(self._native_book, CSVSheetStream):
+            return self._native_book.get_sheet_names()
+        return BookReader.get_sheet_names(self)
+
+    def read_sheet_by_name(self, sheet_name):
+        if isinstance(self._native_book, CSVSheetStream):
+            return self.read_many([sheet_name])
+        return BookReader.read_sheet_by_name(self, sheet_name)
+
+    def read_sheet_by_index(self, sheet_index):
+        if isinstance(self._native_book, CSVSheetStream) and sheet_index >= 0:
+            return self.read_many([sheet_index])
+        return BookReader.read_sheet_by_index(self, sheet_index)
+
+    def read_many(self, sheets):
+        negative_index = [sheet for sheet in sheets
+                          if isinstance(sheet, int) and sheet < 0]
+        if negative_index or not isinstance(self._native_book,
+                                            CSVSheetStream):
+            return BookReader.read_many(self, sheets)
+        # the sheets of a stream are picked out in one pass
+        found = self._native_book.select(sheets)
+        result = compact.OrderedDict()
+        for sheet in sheets:
+            if sheet in found:
+                result[found[sheet].name] = self.read_sheet(found[sheet])
+            elif isinstance(sheet, int):
+                self.close()
+                raise IndexError("list index out of range")
+            else:
+                raise ValueError("Cannot find sheet %s" % sheet)
+        return result
+
+    def count_rows(self):
+        return self.__measure('count_rows')
+
+    def get_dimensions(self):
+        return self.__measure('get_dimensions')
+
     def read_sheet(self, native_sheet):
+        reader = self.__make_reader(native_sheet)
+        self.inferred_column_types[
+            native_sheet.name] = reader.inferred_column_types
+        return reader.to_array()
+
+    def __measure(self, measure):
+        result = compact.OrderedDict()
+        for sheet in self._native_book:
+            reader = self.__make_reader(sheet)
+            result[sheet.name] = getattr(reader, measure)()
+            if not self.__load_from_memory_flag:
+                reader.close()
+        return result
+
+    def __make_reader(self, native_sheet):
         if self.__load_from_memory_flag:
             reader = CSVinMemoryReader(native_sheet, **self._keywords)
         else:
             reader = CSVFileReader(native_sheet, **self._keywords)
             self.__readers.append(reader)
-        return reader.to_array()
+        return reader
 
     def close(self):
         for reader in self.__readers:
@@ -273,28 +1385,53 @@ class CSVBookReader(BookReader):
         self.__line_terminator = self._keywords.get(
             constants.KEYWORD_LINE_TERMINATOR,
             self.__line_terminator)
-        separator = DEFAULT_SHEET_SEPARATOR_FORMATTER % self.__line_terminator
         if self.__multiple_sheets:
-            # will be slow for large files
-            self._file_stream.seek(0)
-            content = self._file_stream.read()
-            sheets = content.split(separator)
-            named_contents = []
-            for sheet in sheets:
-                if sheet == '':  # skip empty named sheet
-                    continue
-                lines = sheet.split(self.__line_terminator)
-                result = re.match(constants.SEPARATOR_MATCHER, lines[0])
-                new_content = '\n'.join(lines[1:])
-                new_sheet = NamedContent(result.group(1),
-                                         compact.StringIO(new_content))
-                named_contents.append(new_sheet)
-            return named_contents
+            if self._file_content is not None:
+                return self.__load_sheets_from_mmap()
+            if hasattr(self._file_stream, 'getvalue'):
+                # the position of a stream in memory is an offset
+                return self.__load_indexed_sheets()
+            blocks = iter(
+                lambda: self._file_stream.read(CSV_SCAN_BLOCK_SIZE), '')
+            return CSVSheetStream(blocks, self.__line_terminator)
         else:
             if hasattr(self._file_stream, 'seek'):
                 self._file_stream.seek(0)
             return [NamedContent(self._file_type, self._file_stream)]
 
+    def __load_indexed_sheets(self):
+        """
+        find all sheets in one scan, then each sheet reads its own range
+        """
+        line_terminator = self.__line_terminator
+        sheets = index_sheets(read_blocks(self._file_stream), line_terminator)
+        return [
+            NamedContent(name, sheet_lines(
+                read_blocks(self._file_stream, start, stop), line_terminator))
+            for name, start, stop in sheets]
+
+    def __load_sheets_from_mmap(self):
+        mmap_obj = self._file_content
+        encoding = self._keywords.get('encoding', 'utf-8')
+        # the content is decoded as if in text mode
+        newline = self.__line_terminator
+        if newline in ('\r\n', '\r'):
+            newline = '\n'
+        terminator = encode_ascii(self.__line_terminator, encoding)
+        if terminator is None:
+            return CSVSheetStream(
+                decode_blocks(mmap_obj, encoding), newline)
+        byte_order_mark = codecs.getincrementalencoder(encoding)().encode(u'')
+        offset = 0
+        if mmap_obj[:len(byte_order_mark)] == byte_order_mark:
+            offset = len(byte_order_mark)
+        sheets = index_sheets(read_blocks(mmap_obj, offset), terminator)
+        return [
+            NamedContent(name.decode(encoding), sheet_lines(
+                decode_blocks(mmap_obj, encoding,
+                              start + offset, stop + offset), newline))
+            for name, start, stop in sheets]
+
     def _load_from_file(self):
         """Load content from a file
 
@@ -9,13 +9,16 @@
 """
 import zipfile
 
-from pyexcel_io._compact import StringIO, PY2
+from pyexcel_io._compact import StringIO, PY2, OrderedDict
 from pyexcel_io.book import BookReader
 from pyexcel_io.constants import FILE_FORMAT_CSVZ
 
 from .csvr import (
     CSVinMemoryReader,
-    NamedContent
+    NamedContent,
+    count_records,
+    get_quotechar,
+    iter_blocks
 )
 
 
@@ -29,6 +32,7 @@ class CSVZipBookReader(BookReader):
         BookReader.__init__(self)
         self._file_type = FILE_FORMAT_CSVZ
         self.zipfile = None
+        self.inferred_column_types = OrderedDict()
 
     def open(self, file_name, **keywords):
         BookReader.open(self, file_name, **keywords)
@@ -39,21 +43,59 @@ class CSVZipBookReader(BookReader):
         self._native_book = self._load_from_file_alike_object(
             self._file_stream)
 
+    def count_rows(self):
+        """
+        count the records of each member in the compressed bytes as they come
+        """
+        result = OrderedDict()
+        for native_sheet in self._native_book:
+            dialect = CSVinMemoryReader(
+                native_sheet, **self._keywords).get_dialect()
+            quotechar = get_quotechar(dialect)
+            specials = dialect.delimiter + (quotechar or '')
+            rows = None
+            if not dialect.escapechar and not dialect.skipinitialspace and all(
+                    ord(character) < 128 for character in specials):
+                # the members are utf-8 encoded, in which only ascii
+                # characters are single bytes
+                member = self.zipfile.open(native_sheet.payload)
+                try:
+                    rows = count_records(iter_blocks(member), quotechar,
+                                         dialect.delimiter)
+                finally:
+                    member.close()
+            if rows is None:
+                rows = self.__make_reader(native_sheet).count_rows()
+            result[native_sheet.name] = rows
+        return result
+
+    def get_dimensions(self):
+        result = OrderedDict()
+        for native_sheet in self._native_book:
+            reader = self.__make_reader(native_sheet)
+            result[native_sheet.name] = reader.get_dimensions()
+        return result
+
     def read_sheet(self, native_sheet):
+        reader = self.__make_reader(native_sheet)
+        self.inferred_column_types[
+            native_sheet.name] = reader.inferred_column_types
+        return reader.to_array()
+
+    def __make_reader(self, native_sheet):
         content = self.zipfile.read(native_sheet.payload)
         if PY2:
             sheet = StringIO(content)
         else:
             sheet = StringIO(content.decode('utf-8'))
 
-        reader = CSVinMemoryReader(
+        return CSVinMemoryReader(
             NamedContent(
                 native_sheet.name,
                 sheet
             ),
             **self._keywords
         )
-        return reader.to_array()
 
     def close(self):
         if self.zipfile:
@@ -11,7 +11,34 @@ import re
 import math
 import datetime
 
-from pyexcel_io._compact import PY2
+from pyexcel_io._compact import PY2, text_type, lru_cache
+
+
+INTEGER_WITH_COMMAS = re.compile('([0-9]+,)*[0-9]+$')
+
+# one pass classification of a csv cell. Each named group corresponds
+# to a converter. Cells that match none of them, e.g. ' 12', '1_000' or
+# 'nan', are handed over to detect_cell_value, which knows all the corner
+# cases of int() and float()
+CELL_TYPE_PATTERN = re.compile(
+    r'(?P<int>[-+]?[0-9]+)\Z|'
+    r'(?P<comma_int>[0-9]+(?:,[0-9]+)+)\Z|'
+    r'(?P<float>[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:e[-+]?[0-9]+)?|'
+    r'[-+]?[0-9]+e[-+]?[0-9]+)\Z|'
+    r'(?P<date>[0-9]{4}-[0-9]{2}-[0-9]{2}'
+    r'(?: [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?)?)\Z|'
+    r'(?P<text>(?!\s*[-+]?(?:nan|inf))\D*)\Z',
+    re.IGNORECASE | re.UNICODE)
+INFINITIES = (float('inf'), float('-inf'))
+# the column types that make_locked_converter sticks to
+LOCKED_COLUMN_TYPES = (int, float, datetime.date, datetime.datetime)
+# canonical iso 8601 dates and datetimes, the same as what csv.writer
+# and odf give. Anything else is left to strptime
+ISO_DATE_TIME_PATTERN = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})\Z|'
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})[ T]([0-9]{2}):([0-9]{2}):([0-9]{2})'
+    r'(?:\.([0-9]{1,6}))?\Z')
+DATE_CACHE_SIZE = 8192
 
 
 def has_no_digits_in_float(value):
@@ -19,30 +46,70 @@ def has_no_digits_in_float(value):
     return value == math.floor(value)
 
 
-def detect_date_value(cell_text):
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date_time(text, separator=' '):
     """
-    Read the date formats that were written by csv.writer
+    Parse 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS' and 'YYYY-MM-DD HH:MM:SS.ffffff'
+
+    Canonical values are sliced up by ISO_DATE_TIME_PATTERN, the rest go
+    through strptime. Results, None included, are memorized because
+    date columns repeat themselves a lot.
+
+    :param separator: between date and time, ' ' for csv and 'T' for ods
+    :returns: a date, a datetime or None if the text is not a date
     """
+    length = len(text)
+    if length > 19:
+        text = text[0:26]
+    elif length != 10 and length != 19:
+        return None
+    matched = ISO_DATE_TIME_PATTERN.match(text)
+    if matched:
+        fields = matched.groups()
+        try:
+            if length == 10:
+                return datetime.date(
+                    int(fields[0]), int(fields[1]), int(fields[2]))
+            elif text[10] == separator and (length == 19) == (
+                    fields[9] is None):
+                microsecond = fields[9] or '0'
+                return datetime.datetime(
+                    int(fields[3]), int(fields[4]), int(fields[5]),
+                    int(fields[6]), int(fields[7]), int(fields[8]),
+                    int(microsecond.ljust(6, '0')))
+        except ValueError:
+            return None
+    return _strptime_date_time(text, length, separator)
+
+
+def _strptime_date_time(text, length, separator):
     ret = None
     try:
-        if len(cell_text) == 10:
+        if length == 10:
             ret = datetime.datetime.strptime(
-                cell_text,
+                text,
                 "%Y-%m-%d")
             ret = ret.date()
-        elif len(cell_text) == 19:
+        elif length == 19:
             ret = datetime.datetime.strptime(
-                cell_text,
-                "%Y-%m-%d %H:%M:%S")
-        elif len(cell_text) > 19:
+                text,
+                "%Y-%m-%d" + separator + "%H:%M:%S")
+        else:
             ret = datetime.datetime.strptime(
-                cell_text[0:26],
-                "%Y-%m-%d %H:%M:%S.%f")
+                text,
+                "%Y-%m-%d" + separator + "%H:%M:%S.%f")
     except ValueError:
         pass
     return ret
 
 
+def detect_date_value(cell_text):
+    """
+    Read the date formats that were written by csv.writer
+    """
+    return parse_date_time(cell_text)
+
+
 def detect_float_value(cell_text):
     try:
         should_we_skip_it = (cell_text.startswith('0') and
@@ -63,14 +130,195 @@ def detect_int_value(cell_text):
     try:
         return int(cell_text)
     except ValueError:
-        pattern = '([0-9]+,)*[0-9]+$'
-        if re.match(pattern, cell_text):
+        if INTEGER_WITH_COMMAS.match(cell_text):
             integer_string = cell_text.replace(',', '')
             return int(integer_string)
         else:
             return None
 
 
+def detect_cell_value(cell_text, auto_detect_int=True,
+                      auto_detect_float=True, auto_detect_datetime=True,
+                      ignore_infinity=True):
+    """
+    Try int, float and date in turn and return the first match
+
+    The cell text is returned as it is if nothing fits.
+    """
+    ret = None
+    if auto_detect_int:
+        ret = detect_int_value(cell_text)
+    if ret is None and auto_detect_float:
+        ret = detect_float_value(cell_text)
+        shall_we_ignore_the_conversion = (
+            (ret in INFINITIES) and ignore_infinity
+        )
+        if shall_we_ignore_the_conversion:
+            ret = None
+    if ret is None and auto_detect_datetime:
+        ret = detect_date_value(cell_text)
+    if ret is None:
+        ret = cell_text
+    return ret
+
+
+def make_cell_converter(auto_detect_int=True, auto_detect_float=True,
+                        auto_detect_datetime=True, ignore_infinity=True):
+    """
+    Return a function that does what detect_cell_value does
+
+    The cell text is classified by CELL_TYPE_PATTERN once and then
+    handed to the converter of its class straight away, hence there
+    is no trial and error on int(), float() and strptime().
+    """
+    def float_or_text(cell_text):
+        if cell_text.startswith('0') and not cell_text.startswith('0.'):
+            return cell_text
+        ret = float(cell_text)
+        if ignore_infinity and ret in INFINITIES:
+            return cell_text
+        return ret
+
+    def convert_int(cell_text):
+        if auto_detect_int and (len(cell_text) == 1 or
+                                not cell_text.startswith('0')):
+            return int(cell_text)
+        if auto_detect_float:
+            return float_or_text(cell_text)
+        return cell_text
+
+    def convert_comma_int(cell_text):
+        if auto_detect_int and not cell_text.startswith('0'):
+            return int(cell_text.replace(',', ''))
+        return cell_text
+
+    def convert_float(cell_text):
+        if auto_detect_float:
+            return float_or_text(cell_text)
+        return cell_text
+
+    def convert_date(cell_text):
+        if auto_detect_datetime:
+            ret = detect_date_value(cell_text)
+            if ret is not None:
+                return ret
+        return cell_text
+
+    def convert_text(cell_text):
+        return cell_text
+
+    if not (auto_detect_int or auto_detect_float or auto_detect_datetime):
+        return convert_text
+
+    # indexed by the group numbers of CELL_TYPE_PATTERN
+    converters = (None, convert_int, convert_comma_int, convert_float,
+                  convert_date, convert_text)
+    match = CELL_TYPE_PATTERN.match
+
+    def convert(cell_text):
+        matched = match(cell_text)
+        if matched is None:
+            return detect_cell_value(
+                cell_text,
+                auto_detect_int=auto_detect_int,
+                auto_detect_float=auto_detect_float,
+                auto_detect_datetime=auto_detect_datetime,
+                ignore_infinity=ignore_infinity)
+        kind = matched.lastindex
+        if kind == 1 and auto_detect_int and not (
+                cell_text.startswith('0') and len(cell_text) > 1):
+            # the most frequent case is done inline
+            return int(cell_text)
+        return converters[kind](cell_text)
+
+    return convert
+
+
+def detect_column_type(cell_values):
+    """
+    Find out the common type of converted cell values
+
+    int and float make float. None is returned when the values
+    disagree or when there is no value at all.
+    """
+    types = set(type(value) for value in cell_values if value != '')
+    if types == set([int, float]):
+        return float
+    if len(types) == 1:
+        return types.pop()
+    return None
+
+
+def make_locked_converter(column_type, convert_cell):
+    """
+    Return a converter that sticks to one column type
+
+    Only int, float and date columns are locked. Cells that do not fit
+    column_type, and the cells of any other column, are given to
+    convert_cell.
+    """
+    if column_type is int:
+        def convert(cell_text):
+            if len(cell_text) == 1 or not cell_text.startswith('0'):
+                try:
+                    return int(cell_text)
+                except ValueError:
+                    pass
+            return convert_cell(cell_text)
+
+    elif column_type is float:
+        def convert(cell_text):
+            ret = detect_float_value(cell_text)
+            if ret is None or ret in INFINITIES:
+                return convert_cell(cell_text)
+            return ret
+
+    elif column_type in (datetime.date, datetime.datetime):
+        def convert(cell_text):
+            ret = detect_date_value(cell_text)
+            if ret is None:
+                return convert_cell(cell_text)
+            return ret
+
+    else:
+        convert = convert_cell
+    return convert
+
+
+def make_declared_converter(column_type):
+    """
+    Return the converter for a declared column type
+
+    int, float, str, datetime.date and datetime.datetime are understood.
+    Anything else is taken as a conversion function.
+    """
+    if column_type is text_type or column_type is str:
+        def convert(cell_text):
+            return cell_text
+
+    elif column_type is datetime.date:
+        def convert(cell_text):
+            ret = detect_date_value(cell_text)
+            if ret is None:
+                raise ValueError("Bad date value %s" % cell_text)
+            if isinstance(ret, datetime.datetime):
+                ret = ret.date()
+            return ret
+
+    elif column_type is datetime.datetime:
+        def convert(cell_text):
+            ret = detect_date_value(cell_text)
+            if ret is None:
+                raise ValueError("Bad date value %s" % cell_text)
+            if not isinstance(ret, datetime.datetime):
+                ret = datetime.datetime(ret.year, ret.month, ret.day)
+            return ret
+
+    else:
+        convert = column_type
+    return convert
+
+
 def float_value(value):
     """convert a value to float"""
     ret = float(value)
@@ -79,25 +327,8 @@ def float_value(value):
 
 def date_value(value):
     """convert to data value accroding ods specification"""
-    ret = "invalid"
-    try:
-        # catch strptime exceptions only
-        if len(value) == 10:
-            ret = datetime.datetime.strptime(
-                value,
-                "%Y-%m-%d")
-            ret = ret.date()
-        elif len(value) == 19:
-            ret = datetime.datetime.strptime(
-                value,
-                "%Y-%m-%dT%H:%M:%S")
-        elif len(value) > 19:
-            ret = datetime.datetime.strptime(
-                value[0:26],
-                "%Y-%m-%dT%H:%M:%S.%f")
-    except ValueError:
-        pass
-    if ret == "invalid":
+    ret = parse_date_time(value, 'T')
+    if ret is None:
         raise Exception("Bad date value %s" % value)
     return ret
 
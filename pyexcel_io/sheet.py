@@ -7,8 +7,10 @@
     :copyright: (c) 2014-2017 by Onni Software Ltd.
     :license: New BSD License, see LICENSE for more details
 """
-from pyexcel_io._compact import irange
-from pyexcel_io.utils import _index_filter
+from itertools import chain, islice
+
+from pyexcel_io._compact import irange, ifilter, text_type, is_string
+from pyexcel_io.utils import _index_filter, _index_window, _column_indices
 import pyexcel_io.constants as constants
 
 
@@ -30,6 +32,9 @@ class SheetReader(object):
                  start_column=0, column_limit=-1,
                  skip_row_func=None, skip_column_func=None,
                  skip_empty_rows=False, row_renderer=None,
+                 intern_strings=False,
+                 intern_pool_size=constants.DEFAULT_INTERN_POOL_SIZE,
+                 batch_size=None, columns=None, row_filter=None,
                  **keywords):
         self._native_sheet = sheet
         self._keywords = {}
@@ -42,47 +47,314 @@ class SheetReader(object):
         self._skip_column = _index_filter
         self._skip_empty_rows = skip_empty_rows
         self._row_renderer = row_renderer
+        self._intern_strings = intern_strings
+        self._intern_pool_size = intern_pool_size
+        self._batch_size = batch_size
+        self._columns = columns
+        self._row_filter = row_filter
+        self._column_indices = None
+        # the index of the first row that row_iterator gives
+        self._first_row = 0
 
         if skip_row_func:
             self._skip_row = skip_row_func
         if skip_column_func:
             self._skip_column = skip_column_func
 
+    def set_window(self, start_row=0, row_limit=-1,
+                   start_column=0, column_limit=-1):
+        """
+        hand over the rows and the columns to read before reading them
+
+        to_array then asks rows() for the row window only and slices each
+        row by the column window before its cells are converted
+        """
+        self._start_row = start_row
+        self._row_limit = row_limit
+        self._start_column = start_column
+        self._column_limit = column_limit
+
     def to_array(self):
         """2 dimentional representation of the content
+
+        lists of rows are given instead of rows when batch_size is set
+        """
+        if self._batch_size:
+            return self.to_batches(self._batch_size)
+        return self._chunked_rows()
+
+    def to_batches(self, batch_size):
+        """
+        the rows of to_array in lists of batch_size rows
+
+        Rows skipped as empty are made up from the rows after them.
+        """
+        read_rows = self._row_reader()
+        batch = []
+        while True:
+            rows = read_rows(batch_size - len(batch))
+            if rows is None:
+                break
+            batch.extend(rows)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _chunked_rows(self):
+        """
+        the rows of to_array, read DEFAULT_READ_CHUNK_SIZE rows at a time
+        """
+        read_rows = self._row_reader()
+        while True:
+            rows = read_rows(constants.DEFAULT_READ_CHUNK_SIZE)
+            if rows is None:
+                break
+            for row in rows:
+                yield row
+
+    def _row_reader(self):
+        """
+        a function that gives the next rows of to_array, up to a given
+        number of them, as a list, or None when there is none left
+
+        Both to_array and to_batches read their rows here. The rows are
+        taken with islice and their cells are converted by list
+        comprehensions, so that there is no generator to resume per row.
+        """
+        rows = iter(self._filter_rows())
+        pick_cells = self._cell_picker()
+        finish_rows = self._finish_rows
+        string_pools = {}
+
+        def read_rows(number_of_rows):
+            chunk = list(islice(rows, number_of_rows))
+            if not chunk:
+                return None
+            return finish_rows(pick_cells(chunk), string_pools)
+        return read_rows
+
+    def _cell_picker(self):
+        """
+        a function that gives the cells of a list of rows of _filter_rows
+
+        The columns are picked by their indices when columns is given.
+        Otherwise, unless skip_column_func is given, the columns are sliced
+        instead of being filtered one by one.
+        """
+        column_indices = self._column_indices
+        if column_indices is not None:
+            select_values = self._select_values
+            return lambda rows: [select_values(row, column_indices)
+                                 for row in rows]
+        if self._skip_column is not _index_filter:
+            filter_columns = self._filter_columns
+            return lambda rows: [list(filter_columns(row)) for row in rows]
+        column_window = slice(*_index_window(
+            self._start_column, self._column_limit))
+        batch_values = self._batch_values
+        return lambda rows: batch_values(rows, column_window)
+
+    def _finish_rows(self, rows, string_pools):
+        """
+        turn lists of cells into the rows of to_array
+
+        Trailing empty cells are cut off, empty rows are skipped when
+        skip_empty_rows is set, then strings are shared and the rows are
+        rendered.
+        """
+        for values in rows:
+            while values and (values[-1] is None or values[-1] == ''):
+                values.pop()
+        if self._skip_empty_rows:
+            rows = [values for values in rows if values]
+        if self._intern_strings:
+            rows = [list(self._share_strings(values, string_pools))
+                    for values in rows]
+        if self._row_renderer:
+            rows = [self._row_renderer(values) for values in rows]
+        return rows
+
+    def _row_values(self, row, column_window):
+        """
+        the cells of a row within column_window, a slice, as a list
+
+        override it when the cells can be sliced before being converted
+        """
+        if self._has_row_values():
+            return self.row_values(row)[column_window]
+        return list(islice(self.column_iterator(row),
+                           column_window.start, column_window.stop))
+
+    def _batch_values(self, rows, column_window):
+        """
+        the cells of rows within column_window, a slice, as lists
+
+        override it when the cells of many rows can be converted at once
+        """
+        if self._has_row_values() and column_window == slice(0, None):
+            row_values = self.row_values
+            return [row_values(row) for row in rows]
+        row_values = self._row_values
+        return [row_values(row, column_window) for row in rows]
+
+    def _select_values(self, row, column_indices):
+        """
+        the cells of a row at column_indices, as a list
+
+        override it when the cells can be picked before being converted
+        """
+        cells = self.row_values(row)
+        length = len(cells)
+        return [cells[index] if index < length else ''
+                for index in column_indices]
+
+    def _apply_to_cells(self, row_filter):
         """
-        for row_index, row in enumerate(self.row_iterator()):
+        turn a function of the cells of a row into one of a row, as
+        row_iterator gives
+
+        override it when the cells can be seen before being converted
+        """
+        row_values = self.row_values
+        return lambda row: row_filter(row_values(row))
+
+    def _has_column_names(self):
+        """
+        tell if any of the columns, or of the columns of row_filter, is
+        given by its name in the header
+        """
+        columns = list(self._columns or [])
+        if isinstance(self._row_filter, dict):
+            columns.extend(self._row_filter)
+        return any(is_string(type(column)) for column in columns)
+
+    def _has_row_values(self):
+        """tell if row_values is overridden to give whole rows"""
+        default = getattr(SheetReader.row_values, '__func__',
+                          SheetReader.row_values)
+        return self.row_values.__func__ is not default
+
+    def _filter_rows(self):
+        header = []
+        if self._skip_row is _index_filter and not self._has_column_names():
+            rows = self.rows(*_index_window(
+                self._start_row, self._row_limit))
+        else:
+            rows = self.row_iterator()
+            if self._has_column_names():
+                rows, header = self.__read_header(rows)
+            if self._skip_row is _index_filter:
+                rows = islice(rows, *_index_window(
+                    self._start_row - self._first_row, self._row_limit))
+            else:
+                rows = self.__filter_rows(rows)
+        if self._columns is not None:
+            self._column_indices = _column_indices(self._columns, header)
+        if self._row_filter is not None:
+            rows = ifilter(self.__make_row_filter(header), rows)
+        return rows
+
+    def __read_header(self, rows):
+        """
+        the rows, as they were, and the first row in text
+        """
+        header = []
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is not None:
+            header = [text_type(cell) for cell in self.row_values(first_row)]
+            rows = chain([first_row], rows)
+        return rows, header
+
+    def __make_row_filter(self, header):
+        """
+        turn row_filter into a function of a row of row_iterator
+
+        a dictionary of columns and predicates keeps a row when all of the
+        predicates hold for their cells
+        """
+        row_filter = self._row_filter
+        if isinstance(row_filter, dict):
+            predicates = list(zip(
+                _column_indices(list(row_filter), header),
+                row_filter.values()))
+
+            def row_filter(cells):
+                length = len(cells)
+                for index, predicate in predicates:
+                    if not predicate(cells[index] if index < length else ''):
+                        return False
+                return True
+        return self._apply_to_cells(row_filter)
+
+    def __filter_rows(self, rows):
+        for row_index, row in enumerate(rows, self._first_row):
             row_position = self._skip_row(
                 row_index, self._start_row, self._row_limit)
             if row_position == constants.SKIP_DATA:
                 continue
             elif row_position == constants.STOP_ITERATION:
                 break
+            yield row
 
-            return_row = []
-            tmp_row = []
+    def _filter_columns(self, row):
+        for column_index, cell_value in enumerate(self.column_iterator(row)):
+            column_position = self._skip_column(
+                column_index, self._start_column, self._column_limit)
+            if column_position == constants.SKIP_DATA:
+                continue
+            elif column_position == constants.STOP_ITERATION:
+                break
+            yield cell_value
 
-            for column_index, cell_value in enumerate(
-                    self.column_iterator(row)):
-                column_position = self._skip_column(
-                    column_index, self._start_column, self._column_limit)
-                if column_position == constants.SKIP_DATA:
-                    continue
-                elif column_position == constants.STOP_ITERATION:
-                    break
+    def _share_strings(self, cells, string_pools):
+        """
+        replace each string cell with the first equal string of its column
 
-                tmp_row.append(cell_value)
-                if cell_value is not None and cell_value != '':
-                    return_row += tmp_row
-                    tmp_row = []
-            if self._skip_empty_rows and len(return_row) < 1:
-                # we by-pass next yeild here
-                # because it is an empty row
-                continue
+        A column stops sharing once it has more than intern_pool_size
+        distinct strings, because it does not repeat itself enough.
+        """
+        for column_index, cell_value in enumerate(cells):
+            if isinstance(cell_value, text_type):
+                pool = string_pools.get(column_index)
+                if pool is None:
+                    pool = string_pools[column_index] = {}
+                if pool is not False:
+                    shared_value = pool.get(cell_value)
+                    if shared_value is not None:
+                        cell_value = shared_value
+                    elif len(pool) < self._intern_pool_size:
+                        pool[cell_value] = cell_value
+                    else:
+                        string_pools[column_index] = False
+            yield cell_value
 
-            if self._row_renderer:
-                return_row = self._row_renderer(return_row)
-            yield return_row
+    def count_rows(self):
+        """
+        the number of rows in the sheet, regardless of start_row and the like
+
+        override it when the rows can be counted without being read
+        """
+        return sum(1 for _ in self.row_iterator())
+
+    def get_dimensions(self):
+        """
+        the number of rows and the number of columns in the sheet
+
+        trailing empty cells are not counted as columns
+        """
+        rows = columns = 0
+        for row in self.row_iterator():
+            rows += 1
+            length = 0
+            for column_index, cell_value in enumerate(self.row_values(row)):
+                if cell_value is not None and cell_value != '':
+                    length = column_index + 1
+            if length > columns:
+                columns = length
+        return rows, columns
 
     def row_iterator(self):
         """
@@ -93,6 +365,27 @@ class SheetReader(object):
         """
         return irange(self.number_of_rows())
 
+    def rows(self, start=0, stop=None):
+        """
+        iterate the rows of row_iterator from start to stop
+
+        override it when a range of rows can be read at once
+        """
+        rows = self.row_iterator()
+        # row_iterator may have started at self._first_row already
+        if stop is not None:
+            stop -= self._first_row
+        return islice(rows, start - self._first_row, stop)
+
+    def row_values(self, row):
+        """
+        the cells of a given row as a new list, which to_array may change
+
+        override it when a whole row can be read at once, instead of
+        cell_value() per cell. to_array uses it then.
+        """
+        return list(self.column_iterator(row))
+
     def column_iterator(self, row):
         """
         iterate each column of a given row
@@ -152,12 +445,25 @@ class SheetWriter(object):
         """
         raise NotImplementedError("Please implement write_row()")
 
+    def write_rows(self, rows):
+        """
+        write a list of rows into the file
+
+        override it when many rows can be written at once
+        """
+        for row in rows:
+            self.write_row(row)
+
     def write_array(self, table):
         """
         For standalone usage, write an array
         """
-        for row in table:
-            self.write_row(row)
+        rows = iter(table)
+        while True:
+            batch = list(islice(rows, constants.DEFAULT_WRITE_BATCH_SIZE))
+            if not batch:
+                break
+            self.write_rows(batch)
 
     def close(self):
         """
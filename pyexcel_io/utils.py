@@ -7,6 +7,10 @@
     :copyright: (c) 2014-2017 by Onni Software Ltd.
     :license: New BSD License, see LICENSE for more details
 """
+from array import array
+from itertools import islice
+
+from pyexcel_io._compact import INT_TYPECODE, zip_longest, is_string
 import pyexcel_io.constants as constants
 
 
@@ -17,6 +21,9 @@ ODS3_PLUGIN = 'pyexcel-ods3'
 XLSXW_PLUGIN = 'pyexcel-xlsxw'
 IO_ITSELF = 'pyexcel-io'
 
+# the largest integer that a double holds without rounding
+MAX_EXACT_INTEGER_IN_FLOAT = 2 ** 53
+
 
 AVAILABLE_READERS = {
     constants.FILE_FORMAT_XLS: [XLS_PLUGIN],
@@ -51,6 +58,27 @@ def _index_filter(current_index, start, limit=-1):
     return out_range
 
 
+def _column_indices(columns, header):
+    """the indices of the columns given by index or by name in the header"""
+    indices = []
+    for column in columns:
+        if is_string(type(column)):
+            if column not in header:
+                raise ValueError("Cannot find column %s" % column)
+            indices.append(header.index(column))
+        else:
+            indices.append(column)
+    return indices
+
+
+def _index_window(start, limit):
+    """start and stop of the indices that _index_filter takes"""
+    stop = None
+    if limit > 0:
+        stop = start + limit
+    return start, stop
+
+
 def is_empty_array(array):
     """
     Check if an array is an array of '' or not
@@ -68,3 +96,121 @@ def swap_empty_string_for_none(array):
         else:
             return value
     return [swap(x) for x in array]
+
+
+def to_columns(rows):
+    """
+    Turn rows into columns
+
+    Short rows are padded with ''. A column of int becomes array('q'),
+    a column of int and float becomes array('d') and the rest stay
+    as lists.
+    """
+    columns = []
+    number_of_rows = 0
+    for row in rows:
+        for _ in range(len(columns), len(row)):
+            columns.append([''] * number_of_rows)
+        for column, cell in zip(columns, row):
+            column.append(cell)
+        for column in columns[len(row):]:
+            column.append('')
+        number_of_rows += 1
+    for index, column in enumerate(columns):
+        columns[index] = _pack_column(column)
+    return columns
+
+
+def _pack_column(values):
+    types = set(type(value) for value in values)
+    if types == set([int]):
+        try:
+            return array(INT_TYPECODE, values)
+        except OverflowError:
+            pass
+    elif types == set([float]) or types == set([int, float]):
+        all_exact = all(
+            abs(value) <= MAX_EXACT_INTEGER_IN_FLOAT
+            for value in values if type(value) is int)
+        if all_exact:
+            return array('d', values)
+    return values
+
+
+def to_numpy(rows, chunk_size=constants.DEFAULT_NUMPY_CHUNK_SIZE,
+             numeric_text=False):
+    """
+    Turn rows into a numpy structured array, one field per column
+
+    The rows are taken in chunks and each column of a chunk is converted
+    by numpy as a whole. int and float columns become int64 and float64,
+    in which '' becomes nan. So do columns of numeric text if numeric_text
+    is True, i.e. when the reader has not detected numbers itself. Everything
+    else is kept as object.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(constants.MESSAGE_NUMPY_NOT_INSTALLED)
+    columns = []
+    number_of_rows = 0
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        chunk_columns = list(zip_longest(*chunk, fillvalue=''))
+        for _ in range(len(columns), len(chunk_columns)):
+            if number_of_rows > 0:
+                columns.append([_empty_numpy_column(numpy, number_of_rows)])
+            else:
+                columns.append([])
+        for index, column in enumerate(columns):
+            if index < len(chunk_columns):
+                column.append(_to_numpy_column(
+                    numpy, chunk_columns[index], numeric_text))
+            else:
+                column.append(_empty_numpy_column(numpy, len(chunk)))
+        number_of_rows += len(chunk)
+    columns = [_join_numpy_column(numpy, chunks) for chunks in columns]
+    result = numpy.empty(number_of_rows, dtype=[
+        ('f%d' % index, column.dtype)
+        for index, column in enumerate(columns)])
+    for index, column in enumerate(columns):
+        result['f%d' % index] = column
+    return result
+
+
+def _to_numpy_column(numpy, values, numeric_text):
+    """returns a numpy array and the mask of '', if any"""
+    column = numpy.array(values)
+    if column.dtype.kind in 'US' and (numeric_text or not any(
+            value != '' and is_string(type(value)) for value in values)):
+        empty = column == ''
+        try:
+            column = numpy.where(empty, 'nan', column).astype(numpy.float64)
+            return column, empty
+        except ValueError:
+            pass
+    elif column.dtype.kind in 'biuf':
+        return column, None
+    return numpy.array(values, dtype=object), None
+
+
+def _empty_numpy_column(numpy, length):
+    return (numpy.full(length, numpy.nan),
+            numpy.ones(length, dtype=bool))
+
+
+def _join_numpy_column(numpy, chunks):
+    dtypes = [column.dtype for column, _ in chunks]
+    if any(dtype.kind == 'O' for dtype in dtypes):
+        objects = []
+        for column, empty in chunks:
+            column = column.astype(object)
+            if empty is not None:
+                column[empty] = ''
+            objects.append(column)
+        return numpy.concatenate(objects)
+    return numpy.concatenate([column for column, _ in chunks]).astype(
+        numpy.result_type(*dtypes))
@@ -9,6 +9,8 @@
 """
 import csv
 import codecs
+import multiprocessing
+from collections import deque
 
 from pyexcel_io.book import BookWriter
 from pyexcel_io.sheet import SheetWriter
@@ -79,6 +81,9 @@ class CSVSheetWriter(SheetWriter):
         """
         self.writer.writerow(array)
 
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+
 
 class CSVFileWriter(CSVSheetWriter):
     """ Write csv to a physical file """
@@ -143,6 +148,48 @@ class CSVMemoryWriter(CSVSheetWriter):
                 [constants.SEPARATOR_FORMATTER % ""])
 
 
+def write_sheets_in_parallel(book_writer, incoming_dict, parallel_sheets,
+                             worker):
+    """
+    hand the sheets to worker processes and commit their results in order
+
+    book_writer makes the task of each sheet with make_sheet_task and takes
+    what the worker gives back with commit_sheet. No more than
+    parallel_sheets sheets are in flight at once.
+    """
+    pending = deque()
+    pool = multiprocessing.Pool(parallel_sheets)
+    try:
+        for sheet_name in incoming_dict:
+            task = book_writer.make_sheet_task(
+                sheet_name, list(incoming_dict[sheet_name]))
+            pending.append(pool.apply_async(worker, (task,)))
+            if len(pending) >= parallel_sheets:
+                book_writer.commit_sheet(pending.popleft().get())
+        while pending:
+            book_writer.commit_sheet(pending.popleft().get())
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def write_csv_file(task):
+    """
+    write a sheet into its own csv file in a worker process
+    """
+    file_name, sheet_name, sheet_index, rows, keywords = task
+    sheet_writer = CSVFileWriter(file_name, sheet_name,
+                                 sheet_index=sheet_index, **keywords)
+    sheet_writer.write_array(rows)
+    sheet_writer.close()
+
+
+def can_write_in_parallel(book_writer, incoming_dict):
+    """python 2 has its own unicode writer, which is not done in parallel"""
+    return (book_writer._parallel_sheets > 1 and len(incoming_dict) > 1 and
+            not compact.PY2)
+
+
 class CSVBookWriter(BookWriter):
     """ write csv with unicode support """
     def __init__(self):
@@ -163,3 +210,22 @@ class CSVBookWriter(BookWriter):
             **self._keywords)
         self.__index = self.__index + 1
         return writer
+
+    def write(self, incoming_dict):
+        in_files = compact.is_string(type(self._file_alike_object))
+        if in_files and can_write_in_parallel(self, incoming_dict):
+            # each worker writes the csv file of its sheet itself
+            write_sheets_in_parallel(
+                self, incoming_dict, self._parallel_sheets, write_csv_file)
+        else:
+            BookWriter.write(self, incoming_dict)
+
+    def make_sheet_task(self, name, rows):
+        task = (self._file_alike_object, name, self.__index, rows,
+                self._keywords)
+        self.__index = self.__index + 1
+        return task
+
+    def commit_sheet(self, result):
+        """the file is written by the worker already"""
+        pass
@@ -14,6 +14,7 @@ from pyexcel_io.book import BookWriter
 from pyexcel_io.constants import DEFAULT_SHEET_NAME, FILE_FORMAT_CSVZ
 
 from .csvw import CSVSheetWriter, UnicodeWriter
+from .csvw import can_write_in_parallel, write_sheets_in_parallel
 
 
 class CSVZipSheetWriter(CSVSheetWriter):
@@ -35,10 +36,13 @@ class CSVZipSheetWriter(CSVSheetWriter):
             import csv
             self.writer = csv.writer(self.content, **self._keywords)
 
+    def get_file_name(self):
+        """the name of the csv file in the zip file"""
+        return "%s.%s" % (self._native_sheet, self.file_extension)
+
     def close(self):
-        file_name = "%s.%s" % (self._native_sheet, self.file_extension)
         self.content.seek(0)
-        self._native_book.writestr(file_name, self.content.read())
+        self._native_book.writestr(self.get_file_name(), self.content.read())
         self.content.close()
 
 
@@ -71,5 +75,35 @@ class CSVZipBookWriter(BookWriter):
         )
         return writer
 
+    def write(self, incoming_dict):
+        if can_write_in_parallel(self, incoming_dict):
+            # the workers serialize the sheets, this process deflates
+            # them into the zip file
+            write_sheets_in_parallel(
+                self, incoming_dict, self._parallel_sheets, serialize_sheet)
+        else:
+            BookWriter.write(self, incoming_dict)
+
+    def make_sheet_task(self, name, rows):
+        if name is None:
+            name = DEFAULT_SHEET_NAME
+        return (name, self._file_type[:3], rows, self._keywords)
+
+    def commit_sheet(self, result):
+        file_name, content = result
+        self.zipfile.writestr(file_name, content)
+
     def close(self):
         self.zipfile.close()
+
+
+def serialize_sheet(task):
+    """
+    write a sheet into csv text in a worker process
+
+    :returns: the file name in the zip file and the csv text
+    """
+    name, file_extension, rows, keywords = task
+    sheet_writer = CSVZipSheetWriter(None, name, file_extension, **keywords)
+    sheet_writer.write_array(rows)
+    return sheet_writer.get_file_name(), sheet_writer.content.getvalue()
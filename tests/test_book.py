@@ -1,5 +1,6 @@
-from nose.tools import raises
+from nose.tools import raises, eq_
 from pyexcel_io.book import RWInterface, BookReader, BookWriter
+from pyexcel_io.sheet import NamedContent
 
 
 @raises(NotImplementedError)
@@ -30,3 +31,30 @@ def test_book_reader_open_stream():
 def test_book_writer():
     writer = BookWriter()
     writer.open_stream("a string")
+
+
+class NamedContentReader(BookReader):
+    def open(self, file_name, **keywords):
+        BookReader.open(self, file_name, **keywords)
+        self._native_book = [NamedContent(name, index)
+                             for index, name in enumerate(file_name)]
+
+    def read_sheet(self, native_sheet):
+        return native_sheet.payload
+
+
+def test_read_sheet_by_name():
+    reader = NamedContentReader()
+    reader.open(['a', 'b', 'c'])
+    eq_(reader.get_sheet_names(), ['a', 'b', 'c'])
+    eq_(reader.read_sheet_by_name('c'), {'c': 2})
+    eq_(reader.read_many(['b', 'a']), {'b': 1, 'a': 0})
+    reader.open(['x'])
+    eq_(reader.read_sheet_by_name('x'), {'x': 0})
+
+
+@raises(ValueError)
+def test_read_sheet_by_duplicated_name():
+    reader = NamedContentReader()
+    reader.open(['a', 'b', 'a'])
+    reader.read_sheet_by_name('a')
@@ -1,22 +1,29 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
 import os
+import mmap
+import json
+import datetime
 from unittest import TestCase
 from textwrap import dedent
 from nose.tools import raises, eq_
 import pyexcel_io.manager as manager
+from pyexcel_io import get_data, get_sheet_names, count_rows, get_dimensions
 from pyexcel_io.sheet import NamedContent
+import pyexcel_io.readers.csvr as csvr
 from pyexcel_io.readers.csvr import (
     CSVSheetReader,
     CSVFileReader,
-    CSVinMemoryReader
+    CSVinMemoryReader,
+    CSVSheetStream
 )
 from pyexcel_io.writers.csvw import (
     CSVFileWriter,
     CSVMemoryWriter
 )
-from pyexcel_io._compact import BytesIO, PY2, StringIO
+from pyexcel_io._compact import BytesIO, PY2, StringIO, text_type
 
 
 class TestReaders(TestCase):
@@ -191,3 +198,667 @@ def test_utf16_memory_encoding():
     if PY2:
         actual = actual.decode('utf-16')
     eq_(actual, u'Äkkilähdöt,Matkakirjoituksia,Matkatoimistot\n')
+
+
+class TestColumnTypeLocking(TestCase):
+    def setUp(self):
+        self.content = dedent("""
+           id,price,day,code,note
+           1,2.5,2016-05-04,A1,
+           2,3,2016-05-05,B2,x
+           3,4.25,2016-05-06,003,
+           4x,5,not a date,123,
+        """).strip('\n')
+
+    def test_inferred_column_types(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            start_row=1, infer_sample_rows=3)
+        result = list(reader.to_array())
+        eq_(reader.inferred_column_types, {
+            0: int,
+            1: float,
+            2: datetime.date
+        })
+        eq_(result, [
+            [1, 2.5, datetime.date(2016, 5, 4), 'A1'],
+            [2, 3.0, datetime.date(2016, 5, 5), 'B2', 'x'],
+            [3, 4.25, datetime.date(2016, 5, 6), '003'],
+            ['4x', 5.0, 'not a date', 123]
+        ])
+
+    def test_text_columns_are_detected(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(
+                'id,qty\n1,n/a\n2,n/a\n3,5\n4,2017-01-02')),
+            start_row=1, infer_sample_rows=2)
+        result = list(reader.to_array())
+        eq_(reader.inferred_column_types, {0: int})
+        eq_(result, [[1, 'n/a'], [2, 'n/a'], [3, 5],
+                     [4, datetime.date(2017, 1, 2)]])
+
+    def test_header_is_not_sampled(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            infer_sample_rows=4)
+        result = list(reader.to_array())
+        eq_(reader.inferred_column_types, {
+            0: int,
+            1: float,
+            2: datetime.date
+        })
+        eq_(result[0], ['id', 'price', 'day', 'code', 'note'])
+        eq_(result[1], [1, 2.5, datetime.date(2016, 5, 4), 'A1'])
+
+    def test_fallback_to_detection(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO("1\n2\n3.5\n007\nabc")),
+            infer_sample_rows=2)
+        result = list(reader.to_array())
+        eq_(reader.inferred_column_types, {0: int})
+        eq_(result, [[1], [2], [3.5], ['007'], ['abc']])
+
+    def test_no_sampling(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)))
+        result = list(reader.to_array())
+        eq_(reader.inferred_column_types, {})
+        eq_(result[3], [3, 4.25, datetime.date(2016, 5, 6), '003'])
+
+
+class TestDeclaredColumnTypes(TestCase):
+    def setUp(self):
+        self.content = dedent("""
+           id,price,day,code
+           1,2.5,2016-05-04,007
+           2,3,2016-05-05 10:00:00,123
+        """).strip('\n')
+
+    def test_by_column_index(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            start_row=1,
+            column_types={1: float, 2: datetime.date, 3: str})
+        result = list(reader.to_array())
+        eq_(result, [
+            [1, 2.5, datetime.date(2016, 5, 4), '007'],
+            [2, 3.0, datetime.date(2016, 5, 5), '123']
+        ])
+
+    def test_by_column_name(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            column_types={'day': datetime.datetime, 'code': int,
+                          'id': lambda value: 'ID' + value})
+        result = list(reader.to_array())
+        eq_(result, [
+            ['id', 'price', 'day', 'code'],
+            ['ID1', 2.5, datetime.datetime(2016, 5, 4), 7],
+            ['ID2', 3, datetime.datetime(2016, 5, 5, 10), 123]
+        ])
+
+    def test_with_inferred_column_types(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            start_row=1, infer_sample_rows=1,
+            column_types={'code': str})
+        result = list(reader.to_array())
+        eq_(result, [
+            [1, 2.5, datetime.date(2016, 5, 4), '007'],
+            [2, 3.0, datetime.datetime(2016, 5, 5, 10), '123']
+        ])
+
+    @raises(ValueError)
+    def test_unknown_column_name(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            column_types={'unknown': int})
+        list(reader.to_array())
+
+    @raises(ValueError)
+    def test_bad_declared_value(self):
+        reader = CSVinMemoryReader(
+            NamedContent('csv', StringIO(self.content)),
+            column_types={'price': int})
+        list(reader.to_array())
+
+
+class TestBatches(TestCase):
+    def setUp(self):
+        self.content = dedent("""
+           id,price,day,code,,
+           1,2.5,2016-05-04,007,,
+           ,,,,,
+           2,3,2016-05-05 10:00:00,123
+           3,,,x,,
+           4
+        """).strip('\n')
+
+    def test_same_rows_as_to_array(self):
+        options = [
+            {},
+            dict(start_row=1, row_limit=3),
+            dict(start_column=1),
+            dict(start_column=1, column_limit=2),
+            dict(skip_empty_rows=True),
+            dict(row_renderer=lambda row: row[::-1]),
+            dict(start_row=1, column_types={0: str, 2: text_type}),
+            dict(column_types={'code': str}, infer_sample_rows=2),
+            dict(column_types={'id': int, 'day': datetime.datetime}),
+            dict(intern_strings=True, auto_detect_int=False),
+            dict(skip_column_func=lambda index, start, limit: index % 2 - 1)
+        ]
+        for keywords in options:
+            reader = CSVinMemoryReader(
+                NamedContent('csv', StringIO(self.content)), **keywords)
+            expected = list(reader.to_array())
+            for batch_size in [1, 2, 4, 100]:
+                reader = CSVinMemoryReader(
+                    NamedContent('csv', StringIO(self.content)),
+                    batch_size=batch_size, **keywords)
+                batches = list(reader.to_array())
+                assert all(len(batch) == batch_size
+                           for batch in batches[:-1])
+                assert 0 < len(batches[-1]) <= batch_size
+                eq_([row for batch in batches for row in batch], expected)
+
+
+class TestParallelReading(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_in_parallel.csv"
+        self.range_size = csvr.CSV_RANGE_SIZE
+        csvr.CSV_RANGE_SIZE = 200
+        cells = ['a', 'say ""hi""', 'two\nlines', 'a,b', '', 'three\r\nlines']
+        with open(self.test_file, 'w') as f:
+            for index in range(300):
+                f.write('%d,%s,"%s",2016-05-04\n' % (
+                    index, index * 0.5, cells[index % len(cells)]))
+
+    def read(self, **keywords):
+        reader = CSVFileReader(
+            NamedContent('csv', self.test_file), **keywords)
+        result = list(reader.to_array())
+        reader.close()
+        return result
+
+    def test_same_rows_in_the_same_order(self):
+        options = [
+            {},
+            dict(start_row=10, row_limit=100),
+            dict(start_column=1, column_limit=2),
+            dict(auto_detect_datetime=False),
+            dict(batch_size=7)
+        ]
+        for keywords in options:
+            eq_(self.read(workers=3, **keywords), self.read(**keywords))
+
+    def test_row_filter_gets_text(self):
+        def row_filter(cells):
+            return cells[0] == '7'
+        expected = [[7, 3.5, 'say "hi"', datetime.date(2016, 5, 4)]]
+        eq_(self.read(row_filter=row_filter), expected)
+        eq_(self.read(workers=2, row_filter=row_filter), expected)
+
+    def test_record_boundaries(self):
+        with open(self.test_file, 'rb') as f:
+            content = f.read()
+        ranges = list(csvr.split_csv_file(self.test_file, 200, b'"'))
+        assert len(ranges) > 1
+        eq_(ranges[0][0], 0)
+        eq_(ranges[-1][1], len(content))
+        for start, stop in ranges:
+            eq_(content[start:stop].count(b'"') % 2, 0)
+            eq_(content[stop - 1:stop], b'\n')
+
+    def test_quote_inside_a_cell(self):
+        csvr.CSV_RANGE_SIZE = 40
+        with open(self.test_file, 'w') as f:
+            for index in range(30):
+                if index == 3:
+                    f.write('3,5" tall,x\n')
+                elif index == 10:
+                    f.write('10,"multi\nline"\n')
+                else:
+                    f.write('%d,a,b\n' % index)
+        expected = self.read()
+        eq_(len(expected), 30)
+        eq_(expected[10], [10, 'multi\nline'])
+        eq_(self.read(workers=3), expected)
+
+    def tearDown(self):
+        csvr.CSV_RANGE_SIZE = self.range_size
+        os.unlink(self.test_file)
+
+
+class TestMemoryMappedReading(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_in_mmap.csv"
+        self.data = [
+            [u'\xc4kkil\xe4hd\xf6t', u'two\r\nlines', 1],
+            [u'\u4eba\u6709', 2.5, u'2016-05-04'],
+            [u'', u'a,b', u'end']
+        ]
+
+    def read(self, encoding, **keywords):
+        reader = CSVFileReader(
+            NamedContent('csv', self.test_file),
+            encoding=encoding, **keywords)
+        result = list(reader.to_array())
+        reader.close()
+        return result
+
+    def test_same_rows_as_text_mode(self):
+        for encoding in ['utf-8', 'utf-8-sig', 'utf-16', 'utf-32-be']:
+            writer = CSVFileWriter(self.test_file, None, encoding=encoding,
+                                   single_sheet_in_book=True)
+            writer.write_array(self.data)
+            writer.close()
+            expected = self.read(encoding)
+            eq_(self.read(encoding, use_mmap=True), expected)
+
+    def test_lines_across_blocks(self):
+        content = u'\u4eba,b\r\nc,"d\re"\n\u6709'.encode('utf-16')
+        for block_size in [1, 2, 3, 5, 1024]:
+            lines = list(csvr.decode_lines(content, 'utf-16', block_size))
+            if not PY2:
+                eq_(lines, [u'\u4eba,b\n', u'c,"d\n', u'e"\n', u'\u6709'])
+
+    def test_empty_file(self):
+        open(self.test_file, 'w').close()
+        eq_(self.read('utf-8', use_mmap=True), [])
+
+    def test_mmap_object_in_any_encoding(self):
+        encodings = ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                     'utf-32', 'utf-32-be', 'gb18030', 'cp1252']
+        for encoding in encodings:
+            text = u'\u20ac' if encoding == 'cp1252' else u'\u4eba'
+            content = [[u'caf\xe9', 1], [], [text, u'end']]
+            writer = CSVFileWriter(self.test_file, None, encoding=encoding,
+                                   single_sheet_in_book=True)
+            writer.write_array(content)
+            writer.close()
+            with open(self.test_file, 'rb') as f:
+                memory_mapped_file = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ)
+                data = get_data(memory_mapped_file, file_type='csv',
+                                encoding=encoding, skip_empty_rows=False)
+                memory_mapped_file.close()
+            eq_(data['csv'], content)
+
+    def tearDown(self):
+        if os.path.exists(self.test_file):
+            os.unlink(self.test_file)
+
+
+class TestMultipleSheetStream(TestCase):
+    def setUp(self):
+        self.content = dedent("""\
+            ---pyexcel:sheet1---
+            1,2
+            3,"a
+            b"
+            ---pyexcel---
+            ---pyexcel:sheet2---
+            4
+            ---pyexcel---
+            ---pyexcel:sheet3---
+            5,6
+            ---pyexcel---
+            """)
+
+    def read(self, **keywords):
+        return get_data(StringIO(self.content), file_type='csv',
+                        multiple_sheets=True, lineterminator='\n',
+                        **keywords)
+
+    def blocks(self, block_size):
+        return [self.content[index:index + block_size]
+                for index in range(0, len(self.content), block_size)]
+
+    def test_split_records(self):
+        text = u'a,b\r\nc\r\n\r\nd'
+        for block_size in [1, 2, 3, 1024]:
+            records = []
+            blocks = [text[index:index + block_size]
+                      for index in range(0, len(text), block_size)]
+            for block in csvr.split_records(blocks, '\r\n'):
+                records += block
+            eq_(records, [u'a,b', u'c', u'', u'd'])
+
+    def test_index_sheets(self):
+        for block_size in [1, 2, 7, 1024]:
+            sheets = csvr.index_sheets(self.blocks(block_size), '\n')
+            eq_([(name, self.content[start:stop])
+                 for name, start, stop in sheets],
+                [('sheet1', '1,2\n3,"a\nb"\n'),
+                 ('sheet2', '4\n'),
+                 ('sheet3', '5,6\n')])
+
+    def test_sheets_in_order(self):
+        book = CSVSheetStream(self.blocks(5), '\n')
+        lines = [(sheet.name, list(sheet.payload)) for sheet in book]
+        eq_(lines, [('sheet1', ['1,2\n', '3,"a\n', 'b"\n']),
+                    ('sheet2', ['4\n']),
+                    ('sheet3', ['5,6\n'])])
+
+    def test_select_drops_the_rest(self):
+        book = CSVSheetStream(self.blocks(5), '\n')
+        found = book.select([2, 'sheet2'])
+        eq_(sorted(found.keys(), key=str), [2, 'sheet2'])
+        eq_(list(found[2].payload), ['5,6\n'])
+        eq_(list(book[0].payload), [])
+
+    def test_read_all(self):
+        data = self.read()
+        eq_(list(data.keys()), ['sheet1', 'sheet2', 'sheet3'])
+        eq_(data['sheet1'], [[1, 2], [3, 'a\nb']])
+
+    def test_read_selected_sheets(self):
+        eq_(self.read(sheet_name='sheet2'), {'sheet2': [[4]]})
+        eq_(self.read(sheet_index=2), {'sheet3': [[5, 6]]})
+        eq_(self.read(sheet_index=-1), {'sheet3': [[5, 6]]})
+        data = self.read(sheets=['sheet3', 0])
+        eq_(list(data.items()), [('sheet3', [[5, 6]]),
+                                 ('sheet1', [[1, 2], [3, 'a\nb']])])
+
+    @raises(ValueError)
+    def test_unknown_sheet_name(self):
+        self.read(sheet_name='unknown')
+
+    @raises(IndexError)
+    def test_sheet_index_out_of_range(self):
+        self.read(sheet_index=3)
+
+    def test_read_from_file_stream(self):
+        test_file = 'multiple_sheets_in_stream.csv'
+        with open(test_file, 'w') as f:
+            f.write(self.content)
+        with open(test_file, 'r') as f:
+            data = get_data(f, file_type='csv', multiple_sheets=True,
+                            lineterminator='\n', sheets=['sheet3', 0])
+        eq_(list(data.items()), [('sheet3', [[5, 6]]),
+                                 ('sheet1', [[1, 2], [3, 'a\nb']])])
+        os.unlink(test_file)
+
+    def test_sheet_names_of_file_stream(self):
+        test_file = 'multiple_sheets_in_stream.csv'
+        with open(test_file, 'w') as f:
+            f.write(self.content)
+        with open(test_file, 'r') as f:
+            eq_(get_sheet_names(f, multiple_sheets=True, lineterminator='\n'),
+                ['sheet1', 'sheet2', 'sheet3'])
+        os.unlink(test_file)
+
+    def test_read_from_mmap(self):
+        test_file = 'multiple_sheets_in_mmap.csv'
+        for encoding in ['utf-8', 'utf-8-sig', 'utf-16']:
+            with open(test_file, 'wb') as f:
+                f.write(self.content.replace('\n', '\r\n').encode(encoding))
+            with open(test_file, 'rb') as f:
+                memory_mapped_file = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ)
+                data = get_data(memory_mapped_file, file_type='csv',
+                                encoding=encoding, multiple_sheets=True)
+                eq_(list(data.keys()), ['sheet1', 'sheet2', 'sheet3'])
+                eq_(data['sheet1'], [[1, 2], [3, 'a\nb']])
+                data = get_data(memory_mapped_file, file_type='csv',
+                                encoding=encoding, multiple_sheets=True,
+                                sheet_name='sheet3')
+                eq_(data, {'sheet3': [[5, 6]]})
+                memory_mapped_file.close()
+        os.unlink(test_file)
+
+
+def test_count_records():
+    content = u'a,"b\nc"\n\n"d""\n",e\nf'
+    for block_size in [1, 2, 3, 5, 1024]:
+        blocks = [content[index:index + block_size]
+                  for index in range(0, len(content), block_size)]
+        eq_(csvr.count_records(blocks, '"'), 4)
+        eq_(csvr.count_records([block.encode('utf-8')
+                                for block in blocks], '"'), 4)
+    eq_(csvr.count_records([content], None), 6)
+    content = u'1,5" tall\n2,"a"b"\n3\t"x\ny"\n'
+    for block_size in [1, 2, 3, 1024]:
+        blocks = [content[index:index + block_size]
+                  for index in range(0, len(content), block_size)]
+        eq_(csvr.count_records(blocks, '"'), 4)
+        eq_(csvr.count_records(blocks, '"', '\t'), 3)
+    eq_(csvr.count_records([u'a\n']), 1)
+    eq_(csvr.count_records([]), 0)
+    eq_(csvr.count_records([u'a\r', u'\nb\r\n']), 2)
+    for blocks in [[u'a\rb'], [u'a\r', u'b'], [b'a\r']]:
+        eq_(csvr.count_records(blocks), None)
+
+
+class TestCountRows(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_count_rows.csv"
+
+    def test_same_rows_as_get_data(self):
+        contents = [u'a\n\n', u'a\nb', u'a,"x\ny",,\r\nb,,\r\n',
+                    u'"人\n",1\n']
+        for content in contents:
+            with open(self.test_file, 'wb') as f:
+                f.write(content.encode('utf-8'))
+            expected = len(get_data(self.test_file)[self.test_file])
+            for keywords in [{}, {'use_mmap': True}]:
+                reader = CSVFileReader(
+                    NamedContent('csv', self.test_file), **keywords)
+                eq_(reader.count_rows(), expected)
+                reader.close()
+            reader = CSVinMemoryReader(NamedContent('csv', StringIO(content)))
+            eq_(reader.count_rows(), expected)
+
+    def test_quote_inside_a_cell(self):
+        with open(self.test_file, 'w') as f:
+            for index in range(1000):
+                cell = '5" tall' if index % 2 else 'short'
+                f.write('%d,%s\n' % (index, cell))
+        eq_(count_rows(self.test_file), {self.test_file: 1000})
+        eq_(count_rows(self.test_file, use_mmap=True), {self.test_file: 1000})
+
+    def test_utf16_file(self):
+        with open(self.test_file, 'wb') as f:
+            f.write(u'人,"a\nb"\n1,2\n'.encode('utf-16'))
+        eq_(count_rows(self.test_file, encoding='utf-16'),
+            {self.test_file: 2})
+
+    def test_escapechar(self):
+        with open(self.test_file, 'w') as f:
+            f.write('a,b\\"\nc\n')
+        eq_(count_rows(self.test_file, escapechar='\\'),
+            {self.test_file: 2})
+
+    def test_dimensions(self):
+        with open(self.test_file, 'w') as f:
+            f.write('1,2,,\n3,4,5,\n\n')
+        eq_(get_dimensions(self.test_file), {self.test_file: (3, 3)})
+
+    def test_lone_carriage_returns(self):
+        content = u'a,b\rc,d\re,f\r'
+        with open(self.test_file, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        eq_(count_rows(self.test_file), {self.test_file: 3})
+        eq_(count_rows(content, file_type='csv'), {'csv': 3})
+        eq_(get_dimensions(content, file_type='csv'), {'csv': (3, 2)})
+        reader = CSVinMemoryReader(NamedContent('csv', StringIO(content)))
+        eq_(reader.count_rows(), 3)
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+class TestRowIndex(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_row_index.csv"
+        self.index_file = self.test_file + csvr.ROW_INDEX_SUFFIX
+        self.data = [[index, u'two\nlines' if index % 3 else u'"a",b']
+                     for index in range(20)]
+        writer = CSVFileWriter(self.test_file, None,
+                               single_sheet_in_book=True)
+        writer.write_array(self.data)
+        writer.close()
+
+    def read(self, **keywords):
+        return get_data(self.test_file, **keywords)[self.test_file]
+
+    def test_index_records(self):
+        content = b'a,"b\nc"\n\n"d""\n",e\nf\n'
+        for block_size in [1, 2, 3, 5, 1024]:
+            blocks = [content[index:index + block_size]
+                      for index in range(0, len(content), block_size)]
+            eq_(csvr.index_records(blocks, 1), [0, 8, 9, 18, 20])
+            eq_(csvr.index_records(blocks, 2), [0, 9, 20])
+        eq_(csvr.index_records([b'a\rb\nc\n'], 1), [0])
+
+    def test_quote_inside_a_cell(self):
+        with open(self.test_file, 'w') as f:
+            for index in range(1000):
+                cell = '5" tall' if index % 2 else 'short'
+                f.write('%d,%s\n' % (index, cell))
+        eq_(len(self.read()), 1000)
+        eq_(self.read(row_index_step=100, start_row=500, row_limit=2),
+            [[500, 'short'], [501, '5" tall']])
+
+    def test_same_rows_as_without_index(self):
+        for start_row in [0, 3, 4, 9, 19, 25]:
+            for row_limit in [-1, 2]:
+                expected = self.read(start_row=start_row, row_limit=row_limit)
+                eq_(self.read(start_row=start_row, row_limit=row_limit,
+                              row_index_step=4), expected)
+        eq_(self.read(start_row=9)[0][0], 9)
+
+    def test_sidecar(self):
+        self.read(start_row=9, row_index_step=4)
+        with open(self.index_file) as f:
+            offsets = json.load(f)['offsets']
+        eq_(len(offsets), 6)
+        with open(self.index_file, 'w') as f:
+            json.dump(dict(size=0), f)
+        eq_(self.read(start_row=9, row_index_step=4)[0][0], 9)
+        with open(self.index_file) as f:
+            eq_(json.load(f)['offsets'], offsets)
+
+    def test_changed_file(self):
+        self.read(start_row=9, row_index_step=4)
+        with open(self.test_file, 'w') as f:
+            f.write(''.join('%d\n' % index for index in range(100, 120)))
+        eq_(self.read(start_row=9, row_index_step=4)[0], [109])
+
+    def tearDown(self):
+        for file_name in [self.test_file, self.index_file]:
+            if os.path.exists(file_name):
+                os.unlink(file_name)
+
+
+class TestColumnSelection(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_columns.csv"
+        with open(self.test_file, 'w') as f:
+            f.write('id,name,price\n1,a,2.5\n2,b\n')
+
+    def read(self, **keywords):
+        return get_data(self.test_file, **keywords)[self.test_file]
+
+    def test_columns_by_index_and_name(self):
+        eq_(self.read(columns=['price', 0]),
+            [['price', 'id'], [2.5, 1], ['', 2]])
+
+    def test_unselected_cells_are_not_converted(self):
+        reader = CSVFileReader(
+            NamedContent('csv', self.test_file), columns=[0],
+            column_types={1: int})
+        eq_(list(reader.to_array()), [['id'], [1], [2]])
+
+    def test_columns_in_memory(self):
+        data = get_data(StringIO(u'1,2,3\n4,5,6'), file_type='csv',
+                        columns=[2, 1])
+        eq_(data['csv'], [[3, 2], [6, 5]])
+
+    @raises(ValueError)
+    def test_unknown_column(self):
+        self.read(columns=['weight'])
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+class TestRowFilter(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_row_filter.csv"
+        with open(self.test_file, 'w') as f:
+            f.write('id,name,price\n1,a,2.5\n2,b\n3,c,x\n')
+
+    def read(self, **keywords):
+        return get_data(self.test_file, **keywords)[self.test_file]
+
+    def test_raw_cells(self):
+        seen = []
+
+        def row_filter(cells):
+            seen.append(cells)
+            return cells[0] == '2'
+        eq_(self.read(row_filter=row_filter, start_row=1), [[2, 'b']])
+        eq_(seen, [['1', 'a', '2.5'], ['2', 'b'], ['3', 'c', 'x']])
+
+    def test_predicates_by_column(self):
+        eq_(self.read(row_filter={'price': lambda cell: cell != '',
+                                  0: lambda cell: cell != 'id'}),
+            [[1, 'a', 2.5], [3, 'c', 'x']])
+
+    def test_rejected_rows_are_not_converted(self):
+        reader = CSVFileReader(
+            NamedContent('csv', self.test_file), start_row=1,
+            column_types={2: float},
+            row_filter=lambda cells: cells[2:] != ['x'])
+        eq_(list(reader.to_array()), [[1, 'a', 2.5], [2, 'b']])
+
+    def test_in_memory(self):
+        data = get_data(StringIO(u'1,2\n3,4'), file_type='csv',
+                        row_filter={1: lambda cell: cell == '4'})
+        eq_(data['csv'], [[3, 4]])
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+def test_split_rows():
+    contents = [u'a,b\r\n\r\nc,,\r\n', u'a\rb,c\r\r', u'1,2\n\n3',
+                u'a,b\n1,"x\r\ny",2\n3,4\n', u'a\tb\n"c\td"\te\n']
+    for content in contents:
+        for delimiter in [',', '\t']:
+            expected = list(csvr.csv.reader(
+                io.StringIO(content, newline=''), delimiter=delimiter))
+            for block_size in [1, 2, 3, 5, 1024]:
+                csvr.MMAP_BLOCK_SIZE = block_size
+                try:
+                    rows = csvr.split_rows(
+                        io.StringIO(content, newline=''), delimiter, u'"',
+                        dict(delimiter=delimiter))
+                    eq_(list(rows), expected)
+                finally:
+                    csvr.MMAP_BLOCK_SIZE = 1024 * 1024
+
+
+class TestFastSplit(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_fast_split.tsv"
+        with open(self.test_file, 'w') as f:
+            f.write('1\ta\r\n\r\n2\t"b\r\nc"\r\n')
+
+    def read(self, **keywords):
+        return get_data(self.test_file, **keywords)[self.test_file]
+
+    def test_same_rows_as_csv_reader(self):
+        expected = self.read(fast_split=False)
+        eq_(len(expected), 3)
+        eq_(self.read(), expected)
+        eq_(self.read(use_mmap=True), expected)
+
+    def test_quote_none(self):
+        eq_(self.read(quoting=csvr.csv.QUOTE_NONE),
+            [[1, 'a'], [], [2, '"b'], ['c"']])
+
+    def tearDown(self):
+        os.unlink(self.test_file)
@@ -1,5 +1,5 @@
 from nose.tools import raises, eq_
-from pyexcel_io import save_data
+from pyexcel_io import get_data, save_data, get_sheet_names
 from pyexcel_io._compact import OrderedDict
 from pyexcel_io.constants import DB_DJANGO
 from pyexcel_io.database.common import (
@@ -347,6 +347,8 @@ class TestMultipleModels:
         for key in data.keys():
             data[key] = list(data[key])
         assert data == self.content
+        eq_(get_sheet_names(exporter, file_type=DB_DJANGO),
+            ['Sheet1', 'Sheet2'])
 
     @raises(Exception)
     def test_special_case_where_only_one_model_used(self):
@@ -429,6 +431,29 @@ class TestFilter:
         expected = [['Y'], [2], [5]]
         eq_(list(data), expected)
 
+    def test_load_sheet_from_django_model_with_columns(self):
+        reader = DjangoModelReader(self.model, columns=['Z', 0])
+        data = reader.to_array()
+        expected = [['Z', 'X'], [3, 1], [6, 4]]
+        eq_(list(data), expected)
+
+    def test_load_book_from_django_model_with_columns(self):
+        self.model._meta.model_name = "Sheet1"
+        exporter = DjangoModelExporter()
+        exporter.append(DjangoModelExportAdapter(self.model, ['X', 'Y']))
+        reader = DjangoBookReader()
+        reader.open_content(exporter, columns=['Y'])
+        data = reader.read_all()
+        eq_(list(data['Sheet1']), [['Y'], [2], [5]])
+
+    def test_get_data_window(self):
+        self.model._meta.model_name = "Sheet1"
+        exporter = DjangoModelExporter()
+        exporter.append(DjangoModelExportAdapter(self.model))
+        data = get_data(exporter, file_type=DB_DJANGO,
+                        start_row=2, row_limit=3, start_column=1)
+        eq_(data['Sheet1'], [[5, 6]])
+
 
 def test_django_model_import_adapter():
     adapter = DjangoModelImportAdapter(FakeDjangoModel)
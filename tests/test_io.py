@@ -1,14 +1,18 @@
 import os
 import sys
 import types
+import zipfile
+from array import array
 from unittest import TestCase
 import pyexcel_io.manager as manager
 import pyexcel_io.exceptions as exceptions
 from pyexcel_io._compact import StringIO, BytesIO, is_string
-from pyexcel_io._compact import OrderedDict
-from pyexcel_io import save_data, get_data, iget_data
+from pyexcel_io._compact import OrderedDict, INT_TYPECODE
+from pyexcel_io import save_data, get_data, iget_data, get_sheet_names
+from pyexcel_io import count_rows, get_dimensions
 from pyexcel_io.io import load_data, get_writer
 from nose.tools import raises, eq_
+from nose import SkipTest
 from zipfile import BadZipfile
 
 
@@ -165,6 +169,187 @@ def test_case_insentivity():
     assert result['csv'] == [[1, 2, 3]]
 
 
+def test_columns_layout():
+    data = [
+        ['id', 'price', 'name'],
+        [1, 2.5, 'a'],
+        [2, 3, 'b'],
+        [3, 4]
+    ]
+    io = manager.get_io("csv")
+    save_data(io, data)
+    io.seek(0)
+    result = get_data(io, start_row=1, layout='columns')
+    ids, prices, names = result['csv']
+    eq_(ids, array(INT_TYPECODE, [1, 2, 3]))
+    eq_(prices, array('d', [2.5, 3.0, 4.0]))
+    eq_(names, ['a', 'b', ''])
+
+
+def test_columns_layout_keeps_mixed_columns_as_list():
+    data = [['id', 1, 10 ** 20], [1, 2 ** 60, 1.5]]
+    io = manager.get_io("csv")
+    save_data(io, data)
+    io.seek(0)
+    result = get_data(io, layout='columns')
+    eq_(result['csv'], [
+        ['id', 1], array(INT_TYPECODE, [1, 2 ** 60]), [10 ** 20, 1.5]])
+
+
+def test_numpy_layout():
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("numpy is not installed")
+    data = [
+        ['id', 'price', 'name', 'note'],
+        [1, 2.5, 'a', 1],
+        [2, '', 'b'],
+        [3, 4, '', 'x']
+    ]
+    io = manager.get_io("csv")
+    save_data(io, data)
+    io.seek(0)
+    result = get_data(io, start_row=1, layout='numpy')['csv']
+    eq_(result.dtype.names, ('f0', 'f1', 'f2', 'f3'))
+    eq_(result['f0'].dtype, numpy.int64)
+    eq_(result['f0'].tolist(), [1, 2, 3])
+    eq_(result['f1'].dtype, numpy.float64)
+    assert numpy.isnan(result['f1'][1])
+    eq_(result['f2'].tolist(), ['a', 'b', ''])
+    eq_(result['f3'].tolist(), [1, '', 'x'])
+
+
+def test_numpy_layout_converts_numeric_text():
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("numpy is not installed")
+    io = manager.get_io("csv")
+    save_data(io, [[1, '2.5'], [3, '']])
+    io.seek(0)
+    result = get_data(io, layout='numpy', auto_detect_int=False,
+                      auto_detect_float=False)['csv']
+    eq_(result['f0'].tolist(), [1.0, 3.0])
+    eq_(result['f1'].dtype, numpy.float64)
+    eq_(result['f1'][0], 2.5)
+    assert numpy.isnan(result['f1'][1])
+
+
+def test_numpy_layout_keeps_detected_text():
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("numpy is not installed")
+    io = manager.get_io("csv")
+    io.write('01234,inf\n5,1.5\n')
+    io.seek(0)
+    eq_(get_data(io)['csv'], [['01234', 'inf'], [5, 1.5]])
+    io.seek(0)
+    result = get_data(io, layout='numpy')['csv']
+    eq_(result['f0'].dtype, numpy.dtype(object))
+    eq_(result['f0'].tolist(), ['01234', 5])
+    eq_(result['f1'].tolist(), ['inf', 1.5])
+
+
+@raises(ValueError)
+def test_unknown_layout():
+    get_data(os.path.join("tests", "fixtures", "test.csv"), layout='table')
+
+
+class TestParallelSheets(TestCase):
+    def setUp(self):
+        self.data = OrderedDict()
+        for index in range(4):
+            self.data['sheet%d' % index] = [
+                [index, row, 'text %d' % row] for row in range(20)]
+        self.test_files = ["parallel_sheets.csv", "parallel_sheets.csvz"]
+        for test_file in self.test_files:
+            save_data(test_file, self.data)
+
+    def test_all_sheets(self):
+        for test_file in self.test_files:
+            expected = get_data(test_file)
+            actual = get_data(test_file, parallel_sheets=3)
+            eq_(list(actual.keys()), list(expected.keys()))
+            eq_(actual, expected)
+
+    def test_some_sheets(self):
+        for test_file in self.test_files:
+            actual = get_data(test_file, sheets=['sheet3', 1],
+                              parallel_sheets=2, start_row=15)
+            eq_(list(actual.keys()), ['sheet3', 'sheet1'])
+            eq_(actual['sheet3'], self.data['sheet3'][15:])
+
+    def test_sheets_are_read_by_the_workers_only(self):
+        from pyexcel_io.readers.csvz import CSVZipBookReader
+        read_sheet = CSVZipBookReader.read_sheet
+        read_sheets = []
+
+        def spy(reader, native_sheet):
+            read_sheets.append(native_sheet.name)
+            return read_sheet(reader, native_sheet)
+        CSVZipBookReader.read_sheet = spy
+        try:
+            actual = get_data(self.test_files[1], parallel_sheets=2)
+        finally:
+            CSVZipBookReader.read_sheet = read_sheet
+        eq_(actual, self.data)
+        eq_(read_sheets, [])
+
+    def test_not_picklable_parameters(self):
+        def renderer(row):
+            return row[:1]
+        actual = get_data(self.test_files[0], parallel_sheets=2,
+                          row_renderer=renderer)
+        eq_(actual['sheet2'], [[2]] * 20)
+
+    def tearDown(self):
+        for test_file in self.test_files[1:]:
+            os.unlink(test_file)
+        for index in range(4):
+            os.unlink("parallel_sheets__sheet%d__%d.csv" % (index, index))
+
+
+class TestParallelSheetWriting(TestCase):
+    def setUp(self):
+        self.data = OrderedDict()
+        for index in range(5):
+            self.data['sheet%d' % index] = [
+                [index, row, 'text\n%d' % row, 1.5] for row in range(20)]
+        self.data['sheet5'] = (row for row in [[1, 2], [3, 4]])
+
+    def test_csv_files(self):
+        save_data("sequential.csv", self.data, lineterminator='\n')
+        self.data['sheet5'] = [[1, 2], [3, 4]]
+        save_data("parallel.csv", self.data, parallel_sheets=2,
+                  lineterminator='\n')
+        for index in range(6):
+            sequential = "sequential__sheet%d__%d.csv" % (index, index)
+            parallel = "parallel__sheet%d__%d.csv" % (index, index)
+            with open(sequential, 'r') as f:
+                expected = f.read()
+            with open(parallel, 'r') as f:
+                eq_(f.read(), expected)
+            os.unlink(sequential)
+            os.unlink(parallel)
+
+    def test_csvz(self):
+        test_file = "parallel.csvz"
+        save_data(test_file, self.data, parallel_sheets=3)
+        self.data['sheet5'] = [[1, 2], [3, 4]]
+        eq_(get_data(test_file), self.data)
+        save_data("sequential.csvz", self.data)
+        with zipfile.ZipFile(test_file) as parallel:
+            eq_(parallel.testzip(), None)
+            with zipfile.ZipFile("sequential.csvz") as sequential:
+                eq_(parallel.namelist(), sequential.namelist())
+                for name in sequential.namelist():
+                    eq_(parallel.read(name), sequential.read(name))
+        os.unlink(test_file)
+        os.unlink("sequential.csvz")
+
+
 def test_file_handle_as_input():
     test_file = "file_handle.csv"
     with open(test_file, 'w') as f:
@@ -250,6 +435,22 @@ def test_generator_is_obtained():
     reader.close()
 
 
+def test_batches_are_obtained():
+    data, reader = iget_data(
+        os.path.join("tests", "fixtures", "test.csv"), batch_size=2)
+    batches = list(data['test.csv'])
+    reader.close()
+    expected = get_data(os.path.join("tests", "fixtures", "test.csv"))
+    eq_([row for batch in batches for row in batch], expected['test.csv'])
+    assert all(len(batch) <= 2 for batch in batches)
+
+
+@raises(ValueError)
+def test_batches_in_columns_layout():
+    get_data(os.path.join("tests", "fixtures", "test.csv"),
+             batch_size=2, layout='columns')
+
+
 def test_generator_can_be_written():
     test_filename = "generator.csv"
     test_fixture = os.path.join("tests", "fixtures", "test.csv")
@@ -315,3 +516,64 @@ class TestReadMultipleSheets(TestCase):
             file_name = self.test_file_formatter % (key, index)
             os.unlink(file_name)
             index = index + 1
+
+
+class TestGetSheetNames(TestCase):
+    def setUp(self):
+        self.data = OrderedDict()
+        self.data.update({'Sheet 1': [[1, 2]]})
+        self.data.update({'Sheet 2': [[3, 4]]})
+
+    def test_csv_file(self):
+        test_file = 'sheet_names.csv'
+        save_data(test_file, [[1, 2]])
+        eq_(get_sheet_names(test_file), [test_file])
+        os.unlink(test_file)
+
+    def test_multiple_csv_files(self):
+        save_data('sheet_names.csv', self.data)
+        eq_(get_sheet_names('sheet_names.csv'), ['Sheet 1', 'Sheet 2'])
+        os.unlink('sheet_names__Sheet 1__0.csv')
+        os.unlink('sheet_names__Sheet 2__1.csv')
+
+    def test_csv_stream(self):
+        io = StringIO()
+        save_data(io, self.data)
+        eq_(get_sheet_names(io, multiple_sheets=True),
+            ['Sheet 1', 'Sheet 2'])
+
+    def test_csvz_file(self):
+        test_file = 'sheet_names.csvz'
+        save_data(test_file, self.data)
+        eq_(get_sheet_names(test_file), ['Sheet 1', 'Sheet 2'])
+        os.unlink(test_file)
+
+
+class TestCountRows(TestCase):
+    def setUp(self):
+        self.data = OrderedDict()
+        self.data.update({'Sheet 1': [[1, 'two\nlines'], [2, 3, '']]})
+        self.data.update({'Sheet 2': [[4]]})
+        self.expected = OrderedDict([('Sheet 1', 2), ('Sheet 2', 1)])
+
+    def test_multiple_csv_files(self):
+        save_data('count_rows.csv', self.data)
+        eq_(count_rows('count_rows.csv'), self.expected)
+        eq_(get_dimensions('count_rows.csv'),
+            {'Sheet 1': (2, 2), 'Sheet 2': (1, 1)})
+        os.unlink('count_rows__Sheet 1__0.csv')
+        os.unlink('count_rows__Sheet 2__1.csv')
+
+    def test_csv_stream(self):
+        io = StringIO()
+        save_data(io, self.data)
+        eq_(count_rows(io, multiple_sheets=True), self.expected)
+
+    def test_csvz_file(self):
+        test_file = 'count_rows.csvz'
+        save_data(test_file, self.data)
+        eq_(count_rows(test_file), self.expected)
+        eq_(count_rows(test_file, escapechar='\\'), self.expected)
+        eq_(get_dimensions(test_file),
+            {'Sheet 1': (2, 2), 'Sheet 2': (1, 1)})
+        os.unlink(test_file)
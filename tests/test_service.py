@@ -1,5 +1,9 @@
+import datetime
+
 from nose.tools import eq_, raises
 from pyexcel_io.service import date_value, time_value
+from pyexcel_io.service import detect_cell_value, make_cell_converter
+from pyexcel_io.service import detect_date_value, parse_date_time
 
 
 def test_date_util_parse():
@@ -50,3 +54,70 @@ def test_fake_date_time_20():
 def test_issue_1_error():
     result = time_value('PT1111')
     eq_(result, None)
+
+
+CELL_SAMPLES = [
+    '0', '00', '007', '-0', '+0', '12', '-12', '+12', '1,234', '1,234,567',
+    '0,123', '1,', ',1', '1.5', '-1.5', '.5', '-.5', '1.', '0.5', '00.5',
+    '01.5', '1e5', '1E-5', '0e5', '1.5e3', '1e999', '-1e999', 'inf',
+    '-Infinity', 'nan', ' nan ', ' 12', '12 ', '1_000', '1 000', 'abc',
+    'information', 'nancy', '-', '.', '+', '2016-05-04', '2016-13-04',
+    '0001-01-01', '2016-05-04 17:39:12', '2016-05-04 17:39:12.100',
+    '2016-05-04 17:39:12.1234567891', '2016-05-04 25:39:12',
+    '2016-05-04T17:39:12', '2016-05-04 17:39:12.', '2016-05-04 17:39:12x',
+    u'٣', u'caf\xe9', '1,234\n', '12\n', '9' * 400
+]
+
+
+def test_compiled_cell_converter():
+    for flags in range(16):
+        keywords = dict(
+            auto_detect_int=bool(flags & 1),
+            auto_detect_float=bool(flags & 2),
+            auto_detect_datetime=bool(flags & 4),
+            ignore_infinity=bool(flags & 8))
+        convert = make_cell_converter(**keywords)
+        for cell in CELL_SAMPLES:
+            expected = detect_cell_value(cell, **keywords)
+            actual = convert(cell)
+            eq_(type(actual), type(expected))
+            eq_(repr(actual), repr(expected))
+
+
+DATE_SAMPLES = [
+    '2016-05-04', '2016-02-29', '2015-02-29', '2016-13-04', '2016-00-04',
+    '0001-01-01', '2016-5-04 ', '2016-05- 4', '2016/05/04', u'\u0662016-05-04',
+    '2016-05-04 17:39:12', '2016-05-04 24:00:00', '2016-05-04 23:59:60',
+    '2016-05-04 7:39:12 ', '2016-05-04T17:39:12', '2016-05-04 17:39:12.1',
+    '2016-05-04 17:39:12.000100', '2016-05-04 17:39:12.1234567891',
+    '2016-05-04 17:39:12.', '2016-05-04 17:39:12.12x', '2016-05-04 17:39:12 ',
+    '2016-05-04T17:39:12.5', '1234567890', '12345678901234567890'
+]
+
+
+def test_parse_date_time():
+    for separator in ' T':
+        for text in DATE_SAMPLES:
+            expected = None
+            date_format = "%Y-%m-%d" + separator + "%H:%M:%S"
+            try:
+                if len(text) == 10:
+                    expected = datetime.datetime.strptime(
+                        text, "%Y-%m-%d").date()
+                elif len(text) == 19:
+                    expected = datetime.datetime.strptime(text, date_format)
+                elif len(text) > 19:
+                    expected = datetime.datetime.strptime(
+                        text[0:26], date_format + ".%f")
+            except ValueError:
+                pass
+            actual = parse_date_time(text, separator)
+            eq_(type(actual), type(expected))
+            eq_(actual, expected)
+
+
+def test_detect_date_value_is_memorized():
+    first = detect_date_value('2016-05-04 17:39:12.000100')
+    second = detect_date_value('2016-05-04 17:39:12.000100')
+    eq_(first, datetime.datetime(2016, 5, 4, 17, 39, 12, 100))
+    assert first is second
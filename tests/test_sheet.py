@@ -1,4 +1,5 @@
 from nose.tools import eq_
+from pyexcel_io._compact import irange
 from pyexcel_io.sheet import SheetWriter, SheetReader
 import pyexcel_io.constants as constants
 
@@ -63,3 +64,162 @@ def test_custom_skip_column_func():
         ]
     eq_(expected, actual)
     reader.close()
+
+
+def test_intern_strings():
+    array = [
+        [u'ACTIVE', u'GB', 1],
+        [u''.join([u'ACT', u'IVE']), u''.join([u'G', u'B']), 2]
+    ]
+    reader = MyReader(array, intern_strings=True)
+    actual = list(reader.to_array())
+    eq_(array, actual)
+    assert actual[0][0] is actual[1][0]
+    assert actual[0][1] is actual[1][1]
+    reader.close()
+
+
+def test_intern_strings_stops_at_pool_size():
+    array = [
+        [u'GB', u'a'],
+        [u'FR', u'b'],
+        [u''.join([u'G', u'B']), u''.join([u'a'])]
+    ]
+    reader = MyReader(array, intern_strings=True, intern_pool_size=1)
+    actual = list(reader.to_array())
+    eq_(array, actual)
+    assert actual[0][0] is not actual[2][0]
+    reader.close()
+
+
+def test_no_string_interning_by_default():
+    array = [
+        [u'ACTIVE'],
+        [u''.join([u'ACT', u'IVE'])]
+    ]
+    reader = MyReader(array)
+    actual = list(reader.to_array())
+    assert actual[0][0] is not actual[1][0]
+    reader.close()
+
+
+def test_to_batches():
+    array = [
+        [1, 2, 3, ''],
+        [4, 5, 6, None],
+        ['', '', '', ''],
+        [7, 8, 9, 10]
+    ]
+    reader = MyReader(array, start_column=1, column_limit=2, batch_size=2)
+    actual = list(reader.to_array())
+    expected = [
+        [[2, 3], [5, 6]],
+        [[], [8, 9]]
+    ]
+    eq_(expected, actual)
+    reader.close()
+
+
+def test_to_batches_with_custom_skip_column_func():
+    array = [
+        [1, 2, 3],
+        [4, 5, 6]
+    ]
+    reader = MyReader(array, skip_column_func=take_second_column)
+    actual = list(reader.to_batches(3))
+    eq_([[[2], [5]]], actual)
+    reader.close()
+
+
+def test_count_rows():
+    reader = MyReader([[1, 2], [3, 4], [5, 6]], start_row=1)
+    eq_(reader.count_rows(), 3)
+
+
+def test_get_dimensions():
+    reader = MyReader([[1, None, ''], [3, 4, None]])
+    eq_(reader.get_dimensions(), (2, 2))
+
+
+def test_columns():
+    reader = MyReader([['a', 'b', 'c'], [1, 2, 3]], columns=['c', 0, 5])
+    eq_(list(reader.to_array()), [['c', 'a'], [3, 1]])
+
+
+def test_columns_after_start_row():
+    reader = MyReader([['a', 'b', 'c'], [1, 2, 3]], columns=['b'],
+                      start_row=1, batch_size=1)
+    eq_(list(reader.to_array()), [[[2]]])
+
+
+def test_row_filter():
+    reader = MyReader([['a', 'b'], [1, 2], [3, 4]],
+                      row_filter=lambda cells: cells[0] != 1)
+    eq_(list(reader.to_array()), [['a', 'b'], [3, 4]])
+
+
+def test_row_filter_by_column_name():
+    reader = MyReader([['a', 'b'], [1, 2], [3, 4]], start_row=1,
+                      row_filter={'b': lambda cell: cell > 2})
+    eq_(list(reader.to_array()), [[3, 4]])
+
+
+class MyBulkReader(MyReader):
+
+    def row_values(self, row):
+        return list(self._native_sheet[row])
+
+    def rows(self, start=0, stop=None):
+        return irange(start, min(stop or self.number_of_rows(),
+                                 self.number_of_rows()))
+
+    def cell_value(self, row, column):
+        raise NotImplementedError("whole rows only")
+
+
+def test_row_values():
+    reader = MyBulkReader([[1, 2, ''], [3, 4, 5]], start_column=1)
+    eq_(list(reader.to_array()), [[2], [4, 5]])
+
+
+def test_rows():
+    reader = MyBulkReader([[1], [2], [3], [4]], start_row=1, row_limit=2)
+    eq_(list(reader.to_array()), [[2], [3]])
+    eq_(reader.get_dimensions(), (4, 1))
+
+
+def test_set_window():
+    reader = MyBulkReader([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    reader.set_window(start_row=1, row_limit=1, start_column=1)
+    eq_(list(reader.to_array()), [[5, 6]])
+
+
+class MyBatchWriter(SheetWriter):
+
+    def __init__(self):
+        SheetWriter.__init__(self, None, None, "somename")
+        self.batches = []
+
+    def write_rows(self, rows):
+        self.batches.append(rows)
+
+
+def test_write_array_in_batches():
+    writer = MyBatchWriter()
+    size = constants.DEFAULT_WRITE_BATCH_SIZE
+    writer.write_array(iter([[index] for index in range(size + 1)]))
+    eq_([len(batch) for batch in writer.batches], [size, 1])
+
+
+def test_write_rows_by_write_row():
+    rows = []
+    writer = MyWriter("somebook", "somesheet", "somename")
+    writer.write_row = rows.append
+    writer.write_rows([[1], [2]])
+    eq_(rows, [[1], [2]])
+
+
+def test_plain_rows():
+    reader = MyReader([[1, '', None], ['', None, ''], [2, 3, '']],
+                      skip_empty_rows=True, start_row=0, row_limit=3)
+    eq_(list(reader.to_array()), [[1], [2, 3]])
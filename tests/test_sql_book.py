@@ -1,12 +1,14 @@
 import sys
 import json
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, Integer, String
 from sqlalchemy import Float, Date, DateTime, ForeignKey
 from sqlalchemy.orm import sessionmaker
 import datetime
+from pyexcel_io import get_data, save_data
 from pyexcel_io._compact import OrderedDict
+from pyexcel_io.constants import DB_SQL
 from pyexcel_io.database.common import (
     SQLTableExporter,
     SQLTableExportAdapter,
@@ -20,7 +22,7 @@ from pyexcel_io.database.importers.sqlalchemy import (
     SQLTableWriter,
     SQLBookWriter)
 from pyexcel_io.database.querysets import QuerysetsReader
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, backref, validates
 from nose.tools import raises, eq_
 import platform
 
@@ -84,6 +86,24 @@ class Category(Base):
         return self.__repr__()
 
 
+class Signature(Base):
+    __tablename__ = 'signature'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+
+    @validates('name')
+    def upper_name(self, key, value):
+        return value.upper()
+
+    @property
+    def initials(self):
+        return self.name
+
+    @initials.setter
+    def initials(self, value):
+        self.name = '.'.join(value) + '.'
+
+
 Session = sessionmaker(bind=engine)
 
 
@@ -135,6 +155,45 @@ class TestSingleRead:
         eq_(list(data), content)
         mysession.close()
 
+    def test_sql_columns(self):
+        mysession = Session()
+        sheet = SQLTableReader(mysession, Pyexcel, columns=['name', 1])
+        data = sheet.to_array()
+        content = [
+            ['name', 'id'],
+            ['Adam', 0],
+            ['Smith', 1]
+        ]
+        eq_(list(data), content)
+        mysession.close()
+
+    def test_sql_window(self):
+        mysession = Session()
+        sheet = SQLTableReader(mysession, Pyexcel)
+        sheet.set_window(start_row=2, row_limit=5, start_column=2)
+        data = sheet.to_array()
+        eq_(list(data), [['Smith', 12.25]])
+        mysession.close()
+
+    def test_get_data_window(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        mysession = Session()
+        exporter = SQLTableExporter(mysession)
+        exporter.append(SQLTableExportAdapter(Pyexcel))
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            data = get_data(exporter, file_type=DB_SQL,
+                            start_row=2, row_limit=3, start_column=2)
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        eq_(data['pyexcel'], [['Smith', 12.25]])
+        assert any('LIMIT' in statement and 'OFFSET' in statement
+                   for statement in statements)
+        mysession.close()
+
     def test_sql_filter(self):
         mysession = Session()
         sheet = SQLTableReader(mysession, Pyexcel, start_row=1)
@@ -509,6 +568,40 @@ class TestNoAutoCommit:
         mysession2.close()
 
 
+class TestBulkInsert:
+    def setUp(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+
+    def save_signatures(self, column_names, rows, **keywords):
+        mysession = Session()
+        importer = SQLTableImporter(mysession)
+        adapter = SQLTableImportAdapter(Signature)
+        adapter.column_names = column_names
+        importer.append(adapter)
+        save_data(importer, {adapter.get_name(): rows},
+                  file_type=DB_SQL, **keywords)
+        names = [signature.name for signature in
+                 mysession.query(Signature).order_by(Signature.id)]
+        mysession.close()
+        return names
+
+    def test_validators_run_by_default(self):
+        names = self.save_signatures(['id', 'name'], [[1, 'adam']])
+        eq_(names, ['ADAM'])
+
+    def test_bulk_insert(self):
+        names = self.save_signatures(['id', 'name'],
+                                     [[1, 'adam'], [2, 'smith']],
+                                     bulk_insert=True)
+        eq_(names, ['adam', 'smith'])
+
+    def test_bulk_insert_with_a_property(self):
+        names = self.save_signatures(['id', 'initials'], [[1, 'ab']],
+                                     bulk_insert=True)
+        eq_(names, ['A.B.'])
+
+
 @raises(TypeError)
 def test_not_implemented_method():
     reader = SQLBookReader()